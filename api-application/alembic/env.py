@@ -15,9 +15,16 @@ sys.path.append(BASE_DIR)
 # ✅ Import Base and all models
 from app.database.session import Base
 import app.models.user_model
-import app.models.audit_trace_model
-import app.models.forgot_password_model
-import app.models.global_setting_model
+import app.models.user_session_model
+import app.models.employer_model
+import app.models.category_model
+import app.models.job_model
+import app.models.candidate_model
+import app.models.candidate_profile
+import app.models.candidate_resume_model
+import app.models.job_application_model
+import app.models.job_application_count_model
+import app.models.maintenance_run_model
 
 # ✅ Alembic Config object
 config = context.config
@@ -29,9 +36,10 @@ if not DATABASE_URL:
 
 config.set_main_option("sqlalchemy.url", DATABASE_URL)
 
-# ✅ Setup logging
-if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+# ✅ Setup logging, unless running inside the app (app.script.migrate passes its connection),
+# whose logging is already configured
+if config.config_file_name is not None and "connection" not in config.attributes:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 # ✅ Set metadata for autogenerate
 target_metadata = Base.metadata
@@ -56,6 +64,14 @@ def run_migrations_offline():
 
 def run_migrations_online():
     """Run migrations in 'online' mode."""
+    # app.script.migrate passes the connection holding its advisory lock
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section),
         prefix="sqlalchemy.",
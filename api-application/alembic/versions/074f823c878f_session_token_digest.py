@@ -0,0 +1,72 @@
+"""Replace stored session JWTs with a unique sha256 digest
+
+Revision ID: 074f823c878f
+Revises: c31bd2250ff6
+Create Date: 2026-10-18 10:04:17.226514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '074f823c878f'
+down_revision: Union[str, Sequence[str], None] = 'c31bd2250ff6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("ALTER TABLE t_user_session ADD COLUMN IF NOT EXISTS token_digest VARCHAR(64)")
+
+    # Same digest as app.utils.token.hash_token: sha256 hex of the UTF-8 token
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 't_user_session' AND column_name = 'access_token'
+            ) THEN
+                UPDATE t_user_session
+                SET token_digest = encode(sha256(convert_to(access_token, 'UTF8')), 'hex')
+                WHERE token_digest IS NULL;
+            END IF;
+        END
+        $$;
+        """
+    )
+
+    # Tokens issued before the jti claim can repeat (same user, same second); keep the newest session
+    op.execute(
+        """
+        DELETE FROM t_user_session a
+        USING t_user_session b
+        WHERE a.token_digest = b.token_digest
+          AND a.pk_id < b.pk_id
+        """
+    )
+
+    op.alter_column("t_user_session", "token_digest", nullable=False)
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_t_user_session_token_digest "
+        "ON t_user_session (token_digest)"
+    )
+
+    op.execute("DROP INDEX IF EXISTS ix_t_user_session_access_token")
+    op.execute("ALTER TABLE t_user_session DROP COLUMN IF EXISTS access_token")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # A digest can't be reversed: old sessions lose their token and have to log in again
+    op.add_column("t_user_session", sa.Column("access_token", sa.Text(), nullable=True))
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_t_user_session_access_token "
+        "ON t_user_session USING hash (access_token)"
+    )
+    op.execute("DROP INDEX IF EXISTS ux_t_user_session_token_digest")
+    op.drop_column("t_user_session", "token_digest")
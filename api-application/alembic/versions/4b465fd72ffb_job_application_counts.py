@@ -0,0 +1,90 @@
+"""Per-job application counts by status, maintained by a trigger; last run of maintenance tasks
+
+Revision ID: 4b465fd72ffb
+Revises: 678f1eb60b15
+Create Date: 2026-10-18 12:41:07.118342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b465fd72ffb'
+down_revision: Union[str, Sequence[str], None] = '678f1eb60b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of app.models.job_application_count_model.APPLICATION_COUNT_TRIGGER_SQL at this revision
+APPLICATION_COUNT_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION fn_t_job_application_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.job_id = NEW.job_id AND OLD.application_status = NEW.application_status THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE t_job_application_count
+           SET total = total - 1
+         WHERE job_id = OLD.job_id AND application_status = OLD.application_status;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO t_job_application_count (job_id, application_status, total)
+        VALUES (NEW.job_id, NEW.application_status, 1)
+        ON CONFLICT (job_id, application_status)
+        DO UPDATE SET total = t_job_application_count.total + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_t_job_application_count ON t_job_application;
+CREATE TRIGGER trg_t_job_application_count
+AFTER INSERT OR DELETE OR UPDATE OF job_id, application_status ON t_job_application
+FOR EACH ROW EXECUTE FUNCTION fn_t_job_application_count();
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        't_job_application_count',
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column(
+            'application_status',
+            postgresql.ENUM(name='applicationstatus', create_type=False),
+            nullable=False,
+        ),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['t_job.pk_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('job_id', 'application_status'),
+    )
+
+    op.create_table(
+        't_maintenance_run',
+        sa.Column('task_name', sa.String(length=64), nullable=False),
+        sa.Column('last_completed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('task_name'),
+    )
+
+    # Block writers until the trigger is live and the backfill has seen every row
+    op.execute("LOCK TABLE t_job_application IN SHARE ROW EXCLUSIVE MODE")
+    op.execute(APPLICATION_COUNT_TRIGGER_SQL)
+    op.execute(
+        """
+        INSERT INTO t_job_application_count (job_id, application_status, total)
+        SELECT job_id, application_status, count(*)
+        FROM t_job_application
+        GROUP BY job_id, application_status
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_t_job_application_count ON t_job_application")
+    op.execute("DROP FUNCTION IF EXISTS fn_t_job_application_count()")
+    op.drop_table('t_job_application_count')
+    op.drop_table('t_maintenance_run')
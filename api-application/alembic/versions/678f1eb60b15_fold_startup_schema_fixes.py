@@ -0,0 +1,77 @@
+"""Fold the startup ALTER scripts (init_user, init_job) into a migration
+
+Revision ID: 678f1eb60b15
+Revises: 85aad739a8b3
+Create Date: 2026-10-18 11:29:58.347704
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '678f1eb60b15'
+down_revision: Union[str, Sequence[str], None] = '85aad739a8b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of app.models.job_model.JOB_SEARCH_VECTOR_SQL at this revision
+JOB_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(job_title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(job_description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(experience_required, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # These used to run from app/script/init_user.py and init_job.py on every worker boot.
+    # Databases created by create_all already match, so every step is idempotent.
+
+    # t_user column types and defaults
+    op.execute("ALTER TABLE t_user ALTER COLUMN is_active TYPE BOOLEAN USING is_active::BOOLEAN")
+    op.execute("ALTER TABLE t_user ALTER COLUMN created_date SET DEFAULT NOW()")
+    op.execute("ALTER TABLE t_user ALTER COLUMN is_active SET DEFAULT TRUE")
+    op.execute("UPDATE t_user SET created_date = NOW() WHERE created_date IS NULL")
+    op.execute("UPDATE t_user SET is_active = TRUE WHERE is_active IS NULL")
+
+    # Keyset pagination indexes on (created_at, pk_id)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_t_job_status_created_at_pk_id "
+        "ON t_job (status, created_at, pk_id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_t_job_employer_id_created_at_pk_id "
+        "ON t_job (employer_id, created_at, pk_id)"
+    )
+
+    # Full-text search column (generated, always in sync) + GIN index
+    op.execute(
+        f"""
+        ALTER TABLE t_job
+            ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS ({JOB_SEARCH_VECTOR_SQL}) STORED
+        """
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_t_job_search_vector ON t_job USING gin (search_vector)")
+
+    # Change tracking for ETag / Last-Modified
+    op.execute("ALTER TABLE t_job ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE")
+    op.execute("UPDATE t_job SET updated_at = created_at WHERE updated_at IS NULL")
+    op.execute(
+        "ALTER TABLE t_job "
+        "ALTER COLUMN updated_at SET DEFAULT NOW(), "
+        "ALTER COLUMN updated_at SET NOT NULL"
+    )
+    op.execute("ALTER TABLE t_employer ADD COLUMN IF NOT EXISTS updated_date TIMESTAMP WITH TIME ZONE")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The t_user fixes only normalise data and are kept
+    op.execute("ALTER TABLE t_employer DROP COLUMN IF EXISTS updated_date")
+    op.execute("ALTER TABLE t_job DROP COLUMN IF EXISTS updated_at")
+    op.execute("DROP INDEX IF EXISTS ix_t_job_search_vector")
+    op.execute("ALTER TABLE t_job DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,31 @@
+"""Index t_job_application (job_id, applied_date, pk_id) for applicant pages
+
+Revision ID: 85657da54a59
+Revises: 4b465fd72ffb
+Create Date: 2026-10-18 13:05:44.502917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '85657da54a59'
+down_revision: Union[str, Sequence[str], None] = '4b465fd72ffb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_t_job_application_job_id_applied_date_pk_id "
+        "ON t_job_application (job_id, applied_date, pk_id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_t_job_application_job_id_applied_date_pk_id")
@@ -0,0 +1,32 @@
+"""Index t_user_session.token_expired for the session reaper
+
+Revision ID: 85aad739a8b3
+Revises: 074f823c878f
+Create Date: 2026-10-18 11:20:57.309058
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '85aad739a8b3'
+down_revision: Union[str, Sequence[str], None] = '074f823c878f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Lets the session reaper find expired rows without scanning the table
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_t_user_session_token_expired "
+        "ON t_user_session (token_expired)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_t_user_session_token_expired")
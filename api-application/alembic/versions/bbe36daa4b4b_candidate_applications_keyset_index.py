@@ -0,0 +1,37 @@
+"""Replace t_job_application (candidate_id) index with (candidate_id, applied_date, pk_id)
+
+Revision ID: bbe36daa4b4b
+Revises: 85657da54a59
+Create Date: 2026-10-18 13:38:12.604193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bbe36daa4b4b'
+down_revision: Union[str, Sequence[str], None] = '85657da54a59'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_t_job_application_candidate_id_applied_date_pk_id "
+        "ON t_job_application (candidate_id, applied_date, pk_id)"
+    )
+    # Its leading column makes the single-column index redundant
+    op.execute("DROP INDEX IF EXISTS ix_t_job_application_candidate_id")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_t_job_application_candidate_id "
+        "ON t_job_application (candidate_id)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_t_job_application_candidate_id_applied_date_pk_id")
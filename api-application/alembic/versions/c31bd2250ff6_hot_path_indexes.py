@@ -0,0 +1,132 @@
+"""Index foreign keys and hot lookup columns
+
+Revision ID: c31bd2250ff6
+Revises:
+Create Date: 2026-10-18 09:12:41.518302
+
+"""
+from typing import Sequence, Union
+
+import logging
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c31bd2250ff6'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+DEDUPE_APPLICATIONS_SQL = """
+WITH ranked AS (
+    SELECT
+        pk_id,
+        first_value(pk_id) OVER w AS kept_pk_id,
+        row_number() OVER w AS position
+    FROM t_job_application
+    WINDOW w AS (
+        PARTITION BY job_id, candidate_id
+        ORDER BY CASE upper(application_status::text)
+                     WHEN 'ACCEPTED' THEN 4
+                     WHEN 'REJECTED' THEN 3
+                     WHEN 'SHORTLISTED' THEN 2
+                     ELSE 1
+                 END DESC,
+                 pk_id DESC
+    )
+)
+DELETE FROM t_job_application a
+USING ranked r
+WHERE a.pk_id = r.pk_id AND r.position > 1
+RETURNING a.pk_id, a.job_id, a.candidate_id, a.application_status, a.applied_date, r.kept_pk_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tables predate Alembic (created by Base.metadata.create_all), and a fresh
+    # create_all already builds these indexes, so every step is idempotent.
+    op.execute("CREATE INDEX IF NOT EXISTS ix_t_employer_user_id ON t_employer (user_id)")
+
+    # t_job.employer_id and t_job.status are served by the leading columns of
+    # ix_t_job_employer_id_created_at_pk_id / ix_t_job_status_created_at_pk_id
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_t_job_status_created_at_pk_id "
+        "ON t_job (status, created_at, pk_id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_t_job_employer_id_created_at_pk_id "
+        "ON t_job (employer_id, created_at, pk_id)"
+    )
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_t_job_application_candidate_id "
+        "ON t_job_application (candidate_id)"
+    )
+
+    # Double-clicked applies may already have produced duplicates. Keep the row with the
+    # most advanced decision (Accepted > Rejected > Shortlisted > Pending), newest on ties,
+    # so an employer's decision is never replaced by a later Pending re-apply.
+    dedupe = sa.text(DEDUPE_APPLICATIONS_SQL)
+    if context.is_offline_mode():
+        op.execute(dedupe)
+    else:
+        for row in op.get_bind().execute(dedupe):
+            logger.warning(
+                "Removed duplicate application pk_id=%s (job_id=%s, candidate_id=%s, status=%s, "
+                "applied_date=%s); kept pk_id=%s",
+                row.pk_id, row.job_id, row.candidate_id, row.application_status, row.applied_date, row.kept_pk_id,
+            )
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_constraint
+                WHERE conname = 'uq_t_job_application_job_id_candidate_id'
+            ) THEN
+                ALTER TABLE t_job_application
+                    ADD CONSTRAINT uq_t_job_application_job_id_candidate_id
+                    UNIQUE (job_id, candidate_id);
+            END IF;
+        END
+        $$;
+        """
+    )
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_t_candidate_resume_candidate_id "
+        "ON t_candidate_resume (candidate_id)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_t_candidate_resume_candidate_id_primary "
+        "ON t_candidate_resume (candidate_id) WHERE is_primary"
+    )
+
+    op.execute("CREATE INDEX IF NOT EXISTS ix_t_user_session_user_id ON t_user_session (user_id)")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_t_user_session_access_token "
+        "ON t_user_session USING hash (access_token)"
+    )
+
+    op.execute("CREATE INDEX IF NOT EXISTS ix_t_user_email_lower ON t_user (lower(email))")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_t_user_email_lower")
+    op.execute("DROP INDEX IF EXISTS ix_t_user_session_access_token")
+    op.execute("DROP INDEX IF EXISTS ix_t_user_session_user_id")
+    op.execute("DROP INDEX IF EXISTS ix_t_candidate_resume_candidate_id_primary")
+    op.execute("DROP INDEX IF EXISTS ix_t_candidate_resume_candidate_id")
+    op.execute(
+        "ALTER TABLE t_job_application "
+        "DROP CONSTRAINT IF EXISTS uq_t_job_application_job_id_candidate_id"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_t_job_application_candidate_id")
+    op.execute("DROP INDEX IF EXISTS ix_t_employer_user_id")
+    # The t_job keyset indexes belong to the job startup script and stay in place
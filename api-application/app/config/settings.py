@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Optional
 
 class Settings(BaseSettings):
     APP_NAME: str
@@ -7,7 +7,76 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str
     DATABASE_URL: str
+    # Read replicas for GET requests; empty means everything goes to DATABASE_URL
+    DATABASE_REPLICA_URLS: List[str] = []
+    # After a successful write, the same client reads from the primary for this long
+    # (bearer clients are tracked in Redis when CACHE_BACKEND=redis, so across workers)
+    REPLICA_STICKINESS_SECONDS: int = 5
+    # Defaults to DATABASE_URL with the asyncpg driver
+    ASYNC_DATABASE_URL: Optional[str] = None
     ALLOWED_ORIGINS: List[str]
+    FACET_CACHE_TTL_SECONDS: int = 30
+
+    # Response cache: "memory" (per worker) or "redis" (shared, needs CACHE_REDIS_URL)
+    CACHE_BACKEND: str = "memory"
+    CACHE_REDIS_URL: Optional[str] = None
+    CACHE_MAX_ENTRIES: int = 1024
+    CACHE_DEFAULT_TTL_SECONDS: int = 60
+
+    # Connection pool, per worker process: workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    # must stay below the server's max_connections
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # More checkouts than this in one request means a second session was opened
+    DB_MAX_CHECKOUTS_PER_REQUEST: int = 1
+
+    # Expose per-request query count and DB time to clients in a Server-Timing header (debug/ops only)
+    SERVER_TIMING_ENABLED: bool = False
+
+    # Same SQL this many times in one request is reported as a likely N+1
+    QUERY_REPEAT_WARN_THRESHOLD: int = 5
+
+    # Statements slower than this are kept for GET /ops/slow-queries; 0 disables
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    # Attach an EXPLAIN plan to each entry; costs an extra round trip per slow statement
+    SLOW_QUERY_EXPLAIN: bool = False
+    # ANALYZE runs the SELECT a second time, so it doubles the cost of every slow read;
+    # statements that write, lock rows or take advisory locks are only planned
+    SLOW_QUERY_EXPLAIN_ANALYZE: bool = False
+    SLOW_QUERY_BUFFER_SIZE: int = 200
+    SLOW_QUERY_LOG_FILE: Optional[str] = None
+
+    # Resolved user/employer/candidate ids per session token. With CACHE_BACKEND=memory a
+    # logout reaches the other workers only when this runs out; redis evicts everywhere at once.
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 10
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 4096
+
+    # Alembic upgrade + seed data from the app lifespan; turn off when a deploy step runs app.script.migrate
+    RUN_MIGRATIONS_ON_STARTUP: bool = True
+
+    # Background deletion of expired t_user_session rows
+    SESSION_REAPER_ENABLED: bool = True
+    SESSION_REAPER_INTERVAL_SECONDS: int = 3600
+    SESSION_REAPER_BATCH_SIZE: int = 1000
+    SESSION_REAPER_MAX_BATCHES: int = 100
+
+    # Recount t_job_application_count against t_job_application (the trigger keeps it exact; this repairs drift)
+    APPLICATION_COUNT_RECONCILE_ENABLED: bool = True
+    APPLICATION_COUNT_RECONCILE_INTERVAL_SECONDS: int = 86400
+    # How often each worker checks whether the last recount (any worker's) is older than the interval
+    APPLICATION_COUNT_RECONCILE_CHECK_SECONDS: int = 3600
+    # Jobs recounted per transaction; only these jobs' applications are locked meanwhile
+    APPLICATION_COUNT_RECONCILE_BATCH_SIZE: int = 500
+
+    # bcrypt runs in its own process pool; beyond MAX_PENDING calls the API answers 503
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 16
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = 10
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 2
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
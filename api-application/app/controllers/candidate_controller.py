@@ -3,6 +3,7 @@ from fastapi import HTTPException, status
 from app.models.candidate_model import Candidate
 from app.models.candidate_profile import CandidateProfile
 from app.schemas.candidate_schema import CandidateCreate, CandidateOut
+from app.dependencies.principal import forget_users
 
 def create_or_update_candidate(db: Session, candidate_data: CandidateCreate, user_id: int) -> CandidateOut:
     """
@@ -25,6 +26,7 @@ def create_or_update_candidate(db: Session, candidate_data: CandidateCreate, use
         db.add(new_candidate)
         db.commit()
         db.refresh(new_candidate)
+        forget_users(user_id)
         return new_candidate
 
 def get_candidate_by_user_id(db: Session, user_id: int) -> Candidate | None:
@@ -47,4 +49,5 @@ def delete_candidate(db: Session, candidate_id: int, user_id: int) -> bool:
         )
     db.delete(db_candidate)
     db.commit()
+    forget_users(user_id)
     return True
\ No newline at end of file
@@ -7,6 +7,8 @@ from shutil import copyfileobj
 from app.models.user_model import User
 from sqlalchemy import func
 from app.models.job_model import Job
+from app.utils.cache import response_cache, employer_tag
+from app.dependencies.principal import forget_users
 
 UPLOAD_DIR = "uploads/employers"  # folder to store logos
 os.makedirs(UPLOAD_DIR, exist_ok=True)
@@ -46,6 +48,27 @@ def get_employers(db: Session):
         for r in rows
     ]
 
+def get_employer_detail(db: Session, employer_id: int):
+    row = (
+        db.query(
+            Employer.pk_id,
+            Employer.company_name,
+            Employer.company_logo,
+            Employer.company_email,
+            Employer.company_contact,
+            Employer.is_active,
+            Employer.created_date,
+            Employer.updated_date,
+            func.count(Job.pk_id).label("job_count"),
+            func.max(Job.updated_at).label("jobs_updated_at"),
+        )
+        .outerjoin(Job, Job.employer_id == Employer.pk_id)
+        .filter(Employer.pk_id == employer_id)
+        .group_by(Employer.pk_id)
+        .first()
+    )
+    return dict(row._mapping) if row else None
+
 def create_employer(db: Session, employer: EmployerCreate, logo_file: UploadFile = None):
     logo_filename = None
     if logo_file:
@@ -68,6 +91,7 @@ def create_employer(db: Session, employer: EmployerCreate, logo_file: UploadFile
     db.add(db_employer)
     db.commit()
     db.refresh(db_employer)
+    forget_users(db_employer.user_id)
     return db_employer
 
 def update_employer(db: Session, employer_id: int, employer: EmployerUpdate, logo_file: UploadFile = None):
@@ -90,6 +114,7 @@ def update_employer(db: Session, employer_id: int, employer: EmployerUpdate, log
     #commit & return
     db.commit()
     db.refresh(db_employer)
+    response_cache.invalidate(employer_tag(employer_id))
     return db_employer
 
 
@@ -99,6 +124,7 @@ def delete_employer(db: Session, employer_id: int):
         return None
     db_employer.is_active = False
     db.commit()
+    response_cache.invalidate(employer_tag(employer_id))
     return db_employer
 
 
@@ -180,5 +206,6 @@ def update_profile_employer(
 
     db.commit()
     db.refresh(db_employer)
+    response_cache.invalidate(employer_tag(db_employer.pk_id))
     return db_employer
 
@@ -1,69 +1,91 @@
+from sqlalchemy import select, func, literal, update, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from app.models.job_application_model import JobApplication, ApplicationStatus
+from app.models.job_application_count_model import JobApplicationCount
 from app.models.job_model import Job, JobStatus
 from app.models.candidate_resume_model import CandidateResume
+from app.models.candidate_model import Candidate
+from app.models.user_model import User
+from app.models.employer_model import Employer
+from app.utils.pagination import keyset_page
 from typing import List, Optional
 from datetime import datetime
 
+def _raise_apply_rejection(db: Session, job_id: int, candidate_id: int, resume_id: Optional[int]):
+    """Work out why the apply upsert wrote nothing; only runs on the failure path"""
+    job_status = db.scalar(select(Job.status).where(Job.pk_id == job_id))
+    if job_status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if job_status != JobStatus.OPEN:
+        raise HTTPException(400, "This job is no longer accepting applications")
+
+    if resume_id:
+        raise HTTPException(400, "Invalid or unauthorized resume")
+    raise HTTPException(400, "No primary resume found. Please set one or select a resume.")
+
+
 def apply_to_job(
     db: Session,
     job_id: int,
     candidate_id: int,
     resume_id: Optional[int] = None,
     reset_status_on_reapply: bool = True,
-) -> JobApplication:
-    
-    job = db.get(Job, job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-
-    if job.status != JobStatus.OPEN:
-        raise HTTPException(400, "This job is no longer accepting applications")
-
-    # ─── Resume validation ───────────────────────────────────────
+):
+    """
+    Apply (or re-apply) in one INSERT ... SELECT ... ON CONFLICT DO UPDATE ... RETURNING.
+    The SELECT only yields a row when the job is open and the resume belongs to the
+    candidate, and the (job_id, candidate_id) unique constraint makes concurrent
+    double-submits converge on a single application.
+    """
+    # ─── Resume: the given one if owned by the candidate, else the primary ───
     if resume_id:
-        resume = db.get(CandidateResume, resume_id)
-        if not resume or resume.candidate_id != candidate_id:
-            raise HTTPException(400, "Invalid or unauthorized resume")
+        resume_filter = (CandidateResume.pk_id == resume_id, CandidateResume.candidate_id == candidate_id)
     else:
-        primary = db.query(CandidateResume).filter(
-            CandidateResume.candidate_id == candidate_id,
-            CandidateResume.is_primary == True
-        ).first()
-        if not primary:
-            raise HTTPException(400, "No primary resume found. Please set one or select a resume.")
-        resume_id = primary.pk_id
-
-    # ─── Look for existing application ───────────────────────────
-    existing = db.query(JobApplication).filter(
-        JobApplication.job_id == job_id,
-        JobApplication.candidate_id == candidate_id
-    ).first()
-
-    if existing:
-        # ─── UPDATE existing application ─────────────────────────
-        existing.candidate_resume_id = resume_id
-        
-        if reset_status_on_reapply:
-            existing.application_status = ApplicationStatus.PENDING
-        
-        db.commit()
-        db.refresh(existing)
-        return existing
-    else:
-        # ─── CREATE new application ──────────────────────────────
-        new_application = JobApplication(
-            job_id=job_id,
-            candidate_id=candidate_id,
-            candidate_resume_id=resume_id,
-            application_status=ApplicationStatus.PENDING,
-            applied_date=datetime.utcnow(),
-        )
-        db.add(new_application)
-        db.commit()
-        db.refresh(new_application)
-        return new_application
+        resume_filter = (CandidateResume.candidate_id == candidate_id, CandidateResume.is_primary.is_(True))
+    resume_pk = (
+        select(CandidateResume.pk_id)
+        .where(*resume_filter)
+        .order_by(CandidateResume.pk_id)
+        .limit(1)
+        .scalar_subquery()
+    )
+
+    source = select(
+        Job.pk_id,
+        literal(candidate_id),
+        resume_pk,
+        literal(ApplicationStatus.PENDING, JobApplication.application_status.type),
+        func.now(),
+    ).where(
+        Job.pk_id == job_id,
+        Job.status == JobStatus.OPEN,
+        resume_pk.is_not(None),
+    )
+
+    stmt = insert(JobApplication).from_select(
+        ["job_id", "candidate_id", "candidate_resume_id", "application_status", "applied_date"],
+        source,
+    )
+    # ─── Re-apply: switch resume (and reset status) on the existing row ──────
+    update_set = {"candidate_resume_id": stmt.excluded.candidate_resume_id}
+    if reset_status_on_reapply:
+        update_set["application_status"] = stmt.excluded.application_status
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_t_job_application_job_id_candidate_id",
+        set_=update_set,
+    ).returning(*JobApplication.__table__.c)
+
+    application = db.execute(stmt).first()
+    if application is None:
+        db.rollback()
+        _raise_apply_rejection(db, job_id, candidate_id, resume_id)
+
+    db.commit()
+    return application
 
 def get_applications_for_job(
     db: Session,
@@ -89,6 +111,74 @@ def get_applications_for_job(
         .all()
     )
 
+def get_applications_for_job_page(
+    db: Session,
+    job_id: int,
+    employer_id: int,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    statuses: Optional[List[ApplicationStatus]] = None,
+    applied_from: Optional[datetime] = None,
+    applied_to: Optional[datetime] = None,
+    include_content: bool = False,
+) -> dict:
+    """
+    Newest-first keyset page of a job's applicants as a flat projection. Resume text,
+    recommendation letter and candidate bio are only selected with include_content.
+    """
+    owned = db.scalar(select(Job.pk_id).where(Job.pk_id == job_id, Job.employer_id == employer_id))
+    if owned is None:
+        raise HTTPException(404, "Job not found or you do not own this job")
+
+    columns = [
+        JobApplication.pk_id,
+        JobApplication.job_id,
+        JobApplication.candidate_id,
+        Candidate.user_id.label("candidate_user_id"),
+        User.user_name.label("candidate_name"),
+        JobApplication.candidate_resume_id,
+        CandidateResume.resume_type,
+        CandidateResume.resume_file,
+        JobApplication.applied_date,
+        JobApplication.application_status,
+    ]
+    if include_content:
+        columns += [
+            Candidate.description.label("candidate_description"),
+            CandidateResume.resume_content,
+            CandidateResume.recommendation_letter,
+        ]
+
+    stmt = (
+        select(*columns)
+        .join(Candidate, Candidate.pk_id == JobApplication.candidate_id)
+        .join(User, User.pk_id == Candidate.user_id)
+        .outerjoin(CandidateResume, CandidateResume.pk_id == JobApplication.candidate_resume_id)
+        .where(JobApplication.job_id == job_id)
+    )
+    if statuses:
+        stmt = stmt.where(JobApplication.application_status.in_(statuses))
+    if applied_from is not None:
+        stmt = stmt.where(JobApplication.applied_date >= applied_from)
+    if applied_to is not None:
+        stmt = stmt.where(JobApplication.applied_date < applied_to)
+
+    page = keyset_page(db, stmt, JobApplication.applied_date, JobApplication.pk_id, limit, cursor, scalars=False)
+    page["items"] = [dict(row._mapping) for row in page["items"]]
+    return page
+
+def get_application_resume_file(db: Session, application_id: int, employer_id: int) -> str:
+    """File name of the uploaded resume an application was made with, if the job is the employer's"""
+    resume_file = db.scalar(
+        select(CandidateResume.resume_file)
+        .join(JobApplication, JobApplication.candidate_resume_id == CandidateResume.pk_id)
+        .join(Job, Job.pk_id == JobApplication.job_id)
+        .where(JobApplication.pk_id == application_id, Job.employer_id == employer_id)
+    )
+    if not resume_file:
+        raise HTTPException(404, "Resume not found or you do not own this application")
+    return resume_file
+
 def update_application_status(
     db: Session,
     application_id: int,
@@ -113,4 +203,205 @@ def update_application_status(
     app.application_status = new_status
     db.commit()
     db.refresh(app)
-    return app
\ No newline at end of file
+    return app
+
+def bulk_update_application_status(
+    db: Session,
+    application_ids: List[int],
+    new_status: ApplicationStatus,
+    employer_id: int
+) -> dict:
+    """
+    Set many applications to one status in a single UPDATE ... FROM t_job ... RETURNING.
+    Ids that are missing or belong to another employer's job come back as not_found.
+    """
+    ids = list(dict.fromkeys(application_ids))
+    stmt = (
+        update(JobApplication)
+        .where(
+            JobApplication.pk_id.in_(ids),
+            JobApplication.job_id == Job.pk_id,
+            Job.employer_id == employer_id,
+        )
+        .values(application_status=new_status)
+        .returning(JobApplication.pk_id)
+        .execution_options(synchronize_session=False)
+    )
+    updated_ids = set(db.scalars(stmt).all())
+    db.commit()
+
+    results = [
+        {"application_id": pk_id, "result": "updated" if pk_id in updated_ids else "not_found"}
+        for pk_id in ids
+    ]
+    return {
+        "new_status": new_status,
+        "updated": len(updated_ids),
+        "not_found": len(ids) - len(updated_ids),
+        "results": results,
+    }
+
+
+def get_application_pipeline(db: Session, employer_id: int) -> List[dict]:
+    """Applications per status for every job of the employer, read from the trigger-maintained counters"""
+    rows = db.execute(
+        select(Job.pk_id, Job.job_title, Job.status, JobApplicationCount.application_status, JobApplicationCount.total)
+        .outerjoin(JobApplicationCount, JobApplicationCount.job_id == Job.pk_id)
+        .where(Job.employer_id == employer_id)
+        .order_by(Job.created_at.desc(), Job.pk_id.desc())
+    ).all()
+
+    pipeline = {}
+    for job_id, job_title, job_status, application_status, total in rows:
+        job = pipeline.setdefault(job_id, {
+            "job_id": job_id,
+            "job_title": job_title,
+            "job_status": job_status,
+            "counts": {status.value: 0 for status in ApplicationStatus},
+            "total": 0,
+        })
+        if application_status is not None:
+            job["counts"][application_status.value] = total
+            job["total"] += total
+    return list(pipeline.values())
+
+
+def reconcile_application_counts(db: Session, batch_size: int = 500) -> dict:
+    """
+    Recompute t_job_application_count from t_job_application and fix any drift,
+    one transaction per batch of jobs. Each batch locks only its own jobs (FOR UPDATE
+    blocks new applications to them) and their applications (FOR SHARE blocks status
+    changes, moves and deletes), so the recount cannot race the trigger while the
+    rest of the table stays writable.
+    """
+    repaired = pruned = batches = 0
+    last_job_id = 0
+    while True:
+        try:
+            job_ids = db.scalars(
+                select(Job.pk_id)
+                .where(Job.pk_id > last_job_id)
+                .order_by(Job.pk_id)
+                .limit(batch_size)
+                .with_for_update()
+            ).all()
+            if not job_ids:
+                db.rollback()
+                break
+
+            db.execute(text("""
+                SELECT count(*) FROM (
+                    SELECT 1 FROM t_job_application WHERE job_id = ANY(:job_ids) FOR SHARE
+                ) locked
+            """), {"job_ids": job_ids})
+            upserted = db.execute(text("""
+                INSERT INTO t_job_application_count (job_id, application_status, total)
+                SELECT job_id, application_status, count(*)
+                FROM t_job_application
+                WHERE job_id = ANY(:job_ids)
+                GROUP BY job_id, application_status
+                ON CONFLICT (job_id, application_status)
+                DO UPDATE SET total = EXCLUDED.total
+                WHERE t_job_application_count.total <> EXCLUDED.total
+                RETURNING job_id
+            """), {"job_ids": job_ids}).all()
+            stale = db.execute(text("""
+                DELETE FROM t_job_application_count c
+                WHERE c.job_id = ANY(:job_ids)
+                  AND NOT EXISTS (
+                    SELECT 1 FROM t_job_application a
+                    WHERE a.job_id = c.job_id AND a.application_status = c.application_status
+                  )
+                RETURNING c.total
+            """), {"job_ids": job_ids}).scalars().all()
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        # Rows left at zero by the trigger are pruned too, but are not drift
+        repaired += len(upserted) + sum(1 for total in stale if total != 0)
+        pruned += len(stale)
+        batches += 1
+        last_job_id = job_ids[-1]
+
+    return {"batches": batches, "repaired": repaired, "pruned": pruned}
+
+
+def my_application_status_stmt(candidate_id: int, job_ids: List[int]):
+    return select(
+        JobApplication.job_id,
+        JobApplication.pk_id,
+        JobApplication.application_status,
+        JobApplication.candidate_resume_id,
+        JobApplication.applied_date,
+    ).where(
+        JobApplication.candidate_id == candidate_id,
+        JobApplication.job_id.in_(job_ids),
+    )
+
+
+def application_status_map(job_ids: List[int], rows) -> dict:
+    """{job_id: status} for every requested job, applied or not"""
+    statuses = {job_id: {"applied": False} for job_id in job_ids}
+    for row in rows:
+        statuses[row.job_id] = {
+            "applied": True,
+            "application_id": row.pk_id,
+            "status": row.application_status,
+            "resume_id": row.candidate_resume_id,
+            "applied_date": row.applied_date,
+        }
+    return statuses
+
+
+def get_my_application_statuses(db: Session, candidate_id: int, job_ids: List[int]) -> dict:
+    job_ids = list(dict.fromkeys(job_ids))
+    if not job_ids:
+        return {}
+    rows = db.execute(my_application_status_stmt(candidate_id, job_ids)).all()
+    return application_status_map(job_ids, rows)
+
+
+async def get_my_application_statuses_async(db: AsyncSession, candidate_id: int, job_ids: List[int]) -> dict:
+    job_ids = list(dict.fromkeys(job_ids))
+    if not job_ids:
+        return {}
+    rows = (await db.execute(my_application_status_stmt(candidate_id, job_ids))).all()
+    return application_status_map(job_ids, rows)
+
+
+def get_my_applications_page(
+    db: Session,
+    candidate_id: int,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    statuses: Optional[List[ApplicationStatus]] = None,
+) -> dict:
+    """A candidate's applications with job, company and resume details, newest first, in one query per page"""
+    stmt = (
+        select(
+            JobApplication.pk_id,
+            JobApplication.job_id,
+            Job.job_title,
+            Job.status.label("job_status"),
+            Job.employer_id,
+            Employer.company_name,
+            Employer.company_logo,
+            JobApplication.application_status,
+            JobApplication.applied_date,
+            JobApplication.candidate_resume_id,
+            CandidateResume.resume_type,
+            CandidateResume.resume_file,
+        )
+        .join(Job, Job.pk_id == JobApplication.job_id)
+        .join(Employer, Employer.pk_id == Job.employer_id)
+        .outerjoin(CandidateResume, CandidateResume.pk_id == JobApplication.candidate_resume_id)
+        .where(JobApplication.candidate_id == candidate_id)
+    )
+    if statuses:
+        stmt = stmt.where(JobApplication.application_status.in_(statuses))
+
+    page = keyset_page(db, stmt, JobApplication.applied_date, JobApplication.pk_id, limit, cursor, scalars=False)
+    page["items"] = [dict(row._mapping) for row in page["items"]]
+    return page
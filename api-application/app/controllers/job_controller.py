@@ -1,11 +1,23 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, exists, tuple_
 from fastapi import HTTPException, status
-from app.models.job_model import Job
-from app.schemas.job_schema import JobCreate, JobUpdate, JobOut
+from app.models.job_model import Job, JobStatus, job_category
+from app.schemas.job_schema import JobCreate, JobUpdate, JobOut, JobSearchFilters, JobFacetsOut
 from app.models.employer_model import Employer
 from sqlalchemy.orm import joinedload
 from app.models.category_model import Category
+from app.utils.pagination import keyset_page
+from app.utils.cache import response_cache, JOBS_TAG, job_tag
+from app.config.settings import settings
+
+MAX_LOCATION_FACETS = 20
+JOB_SNIPPET_LENGTH = 200
+
+
+def invalidate_job_cache(job_id: int):
+    """Drop cached listings, facets and the detail body that may include this job"""
+    response_cache.invalidate(JOBS_TAG, job_tag(job_id))
 
 
 def create_job(db: Session, job_data: JobCreate, user_id: int) -> JobOut:
@@ -32,6 +44,7 @@ def create_job(db: Session, job_data: JobCreate, user_id: int) -> JobOut:
     db.add(db_job)
     db.commit()
     db.refresh(db_job)
+    invalidate_job_cache(db_job.pk_id)
 
     # Make sure categories are loaded
     _ = db_job.categories
@@ -43,9 +56,15 @@ def get_job(db: Session, job_id: int) -> Job | None:
     return db.get(Job, job_id)
 
 
+async def get_job_async(db: AsyncSession, job_id: int) -> Job | None:
+    # The response embeds the employer; async sessions can't lazy-load it later
+    return await db.get(Job, job_id, options=[joinedload(Job.employer)])
+
+
 def get_jobs_by_employer(db: Session, employer_id: int, skip: int = 0, limit: int = 20) -> list[Job]:
     stmt = (
         select(Job)
+        .options(joinedload(Job.employer))
         .where(Job.employer_id == employer_id)
         .offset(skip)
         .limit(limit)
@@ -54,8 +73,8 @@ def get_jobs_by_employer(db: Session, employer_id: int, skip: int = 0, limit: in
     return db.scalars(stmt).all()
 
 
-def get_all_active_jobs(db: Session, skip: int = 0, limit: int = 50) -> list[Job]:
-    stmt = (
+def active_jobs_stmt(skip: int = 0, limit: int = 50):
+    return (
         select(Job)
         .options(
             joinedload(Job.employer),
@@ -66,7 +85,208 @@ def get_all_active_jobs(db: Session, skip: int = 0, limit: int = 50) -> list[Job
         .limit(limit)
         .order_by(Job.created_at.desc())
     )
-    return db.scalars(stmt).all()
+
+
+def get_all_active_jobs(db: Session, skip: int = 0, limit: int = 50) -> list[Job]:
+    return db.scalars(active_jobs_stmt(skip, limit)).all()
+
+
+async def get_all_active_jobs_async(db: AsyncSession, skip: int = 0, limit: int = 50) -> list[Job]:
+    return (await db.scalars(active_jobs_stmt(skip, limit))).all()
+
+
+def get_jobs_by_employer_page(db: Session, employer_id: int, limit: int = 20, cursor: str | None = None) -> dict:
+    stmt = (
+        select(Job)
+        .options(joinedload(Job.employer))
+        .where(Job.employer_id == employer_id)
+    )
+    return keyset_page(db, stmt, Job.created_at, Job.pk_id, limit, cursor)
+
+
+def get_active_jobs_page(db: Session, limit: int = 50, cursor: str | None = None) -> dict:
+    """Open jobs, newest first, paged on (created_at, pk_id) instead of OFFSET"""
+    stmt = (
+        select(Job)
+        .options(joinedload(Job.employer))
+        .where(Job.status == "Open")
+    )
+    return keyset_page(db, stmt, Job.created_at, Job.pk_id, limit, cursor)
+
+
+def get_categories_by_job(db: Session, job_ids: list[int]) -> dict[int, list[dict]]:
+    """One IN query for the categories of a whole page of jobs"""
+    categories = {job_id: [] for job_id in job_ids}
+    if not job_ids:
+        return categories
+
+    rows = db.execute(
+        select(job_category.c.job_id, Category.pk_id, Category.name)
+        .join(Category, Category.pk_id == job_category.c.category_id)
+        .where(job_category.c.job_id.in_(job_ids))
+        .order_by(Category.name)
+    ).all()
+    for row in rows:
+        categories[row.job_id].append({"pk_id": row.pk_id, "name": row.name})
+    return categories
+
+
+def get_active_job_summaries_page(
+    db: Session,
+    limit: int = 50,
+    cursor: str | None = None,
+    with_categories: bool = True,
+) -> dict:
+    """
+    Open jobs as light list cards: selects only the columns a card shows plus a
+    description snippet cut in SQL, so large text columns never leave Postgres.
+    """
+    stmt = (
+        select(
+            Job.pk_id,
+            Job.employer_id,
+            Employer.company_name,
+            Employer.company_logo,
+            Job.job_title,
+            Job.job_type,
+            Job.level,
+            Job.salary_range,
+            Job.location,
+            func.left(Job.job_description, JOB_SNIPPET_LENGTH).label("description_snippet"),
+            Job.posting_date,
+            Job.closing_date,
+            Job.status,
+            Job.created_at,
+        )
+        .join(Employer, Employer.pk_id == Job.employer_id)
+        .where(Job.status == "Open")
+    )
+    page = keyset_page(db, stmt, Job.created_at, Job.pk_id, limit, cursor, scalars=False)
+
+    items = [dict(row._mapping) for row in page["items"]]
+    if with_categories:
+        categories = get_categories_by_job(db, [item["pk_id"] for item in items])
+        for item in items:
+            item["categories"] = categories[item["pk_id"]]
+
+    page["items"] = items
+    return page
+
+
+def job_search_conditions(filters: JobSearchFilters) -> list:
+    """WHERE clauses shared by search and facet queries"""
+    if filters.status == JobStatus.DRAFT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Draft jobs are not searchable"
+        )
+
+    conditions = [Job.status == filters.status]
+
+    if filters.q:
+        ts_query = func.websearch_to_tsquery("english", filters.q)
+        conditions.append(Job.search_vector.op("@@")(ts_query))
+    if filters.job_type:
+        conditions.append(Job.job_type == filters.job_type)
+    if filters.level:
+        conditions.append(Job.level == filters.level)
+    if filters.category_id:
+        conditions.append(
+            exists().where(
+                job_category.c.job_id == Job.pk_id,
+                job_category.c.category_id == filters.category_id,
+            )
+        )
+    if filters.location:
+        conditions.append(Job.location.ilike(f"%{filters.location}%"))
+
+    return conditions
+
+
+def search_jobs(db: Session, filters: JobSearchFilters, skip: int = 0, limit: int = 20) -> list[Job]:
+    """Full-text search over the GIN-indexed search_vector, best matches first"""
+    stmt = (
+        select(Job)
+        .options(joinedload(Job.employer))
+        .where(*job_search_conditions(filters))
+    )
+
+    if filters.q:
+        ts_query = func.websearch_to_tsquery("english", filters.q)
+        stmt = stmt.order_by(func.ts_rank_cd(Job.search_vector, ts_query).desc())
+
+    stmt = stmt.order_by(Job.created_at.desc(), Job.pk_id.desc()).offset(skip).limit(limit)
+    return db.scalars(stmt).unique().all()
+
+
+def get_job_facets(db: Session, filters: JobSearchFilters) -> JobFacetsOut:
+    """
+    Counts per job type, level, category and location for the current filters,
+    computed by one GROUPING SETS query instead of one request per facet.
+    """
+    cache_key = f"jobs:facets:{filters.model_dump_json()}"
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return JobFacetsOut.model_validate_json(cached)
+    snapshot = response_cache.snapshot()
+
+    stmt = (
+        select(
+            func.grouping(Job.job_type).label("by_type"),
+            func.grouping(Job.level).label("by_level"),
+            func.grouping(Job.location).label("by_location"),
+            func.grouping(Category.pk_id).label("by_category"),
+            Job.job_type,
+            Job.level,
+            Job.location,
+            Category.pk_id.label("category_id"),
+            Category.name.label("category_name"),
+            func.count(Job.pk_id.distinct()).label("job_count"),
+        )
+        .outerjoin(job_category, job_category.c.job_id == Job.pk_id)
+        .outerjoin(Category, Category.pk_id == job_category.c.category_id)
+        .where(*job_search_conditions(filters))
+        .group_by(
+            func.grouping_sets(
+                tuple_(Job.job_type),
+                tuple_(Job.level),
+                tuple_(Job.location),
+                tuple_(Category.pk_id, Category.name),
+                tuple_(),
+            )
+        )
+    )
+
+    facets = {"total": 0, "job_type": [], "level": [], "category": [], "location": []}
+    for row in db.execute(stmt).all():
+        # grouping() is 0 for the column(s) the row was grouped by
+        if row.by_type == 0:
+            facets["job_type"].append({"value": row.job_type.value, "count": row.job_count})
+        elif row.by_level == 0:
+            facets["level"].append({"value": row.level.value, "count": row.job_count})
+        elif row.by_location == 0:
+            if row.location:
+                facets["location"].append({"value": row.location, "count": row.job_count})
+        elif row.by_category == 0:
+            if row.category_id is not None:
+                facets["category"].append({
+                    "pk_id": row.category_id,
+                    "value": row.category_name,
+                    "count": row.job_count,
+                })
+        else:
+            facets["total"] = row.job_count
+
+    for name in ("job_type", "level", "category", "location"):
+        facets[name].sort(key=lambda facet: (-facet["count"], facet["value"] or ""))
+    facets["location"] = facets["location"][:MAX_LOCATION_FACETS]
+
+    result = JobFacetsOut(**facets)
+    response_cache.set(
+        cache_key, result.model_dump_json().encode(), tags=(JOBS_TAG,),
+        ttl=settings.FACET_CACHE_TTL_SECONDS, snapshot=snapshot,
+    )
+    return result
 
 
 def update_job(db: Session, job_id: int, job_data: JobUpdate, employer_id: int) -> Job | None:
@@ -98,8 +318,12 @@ def update_job(db: Session, job_id: int, job_data: JobUpdate, employer_id: int)
         else:
             db_job.categories = []
 
+    # Category-only edits don't touch t_job, so bump the version explicitly
+    db_job.updated_at = func.now()
+
     db.commit()
     db.refresh(db_job)
+    invalidate_job_cache(db_job.pk_id)
     _ = db_job.categories  # Ensure categories are loaded
     return db_job
 
@@ -116,4 +340,5 @@ def delete_job(db: Session, job_id: int, employer_id: int) -> Job | None:
 
     db.delete(db_job)
     db.commit()
+    invalidate_job_cache(job_id)
     return db_job
\ No newline at end of file
@@ -1,23 +1,25 @@
 
 from sqlalchemy.orm import Session
+from sqlalchemy import func, select, delete
 from app.models.candidate_profile import CandidateProfile
 from app.models.user_model import User
 from app.models.user_session_model import UserSession
 from app.schemas.user_schema import DeleteUser, UserCreate, ChangePassword, UpdateUserProfile, UserResponse
-from passlib.context import CryptContext
 from app.models.job_model import Job
-from jose import jwt
 from datetime import timedelta, datetime, timezone
+from uuid import uuid4
 from app.config.settings import settings  # secret + algorithm from env/config
 from fastapi import HTTPException
 from app.enums.global_enum import UserType
 from app.models.employer_model import Employer
 from app.models.candidate_model import Candidate
+from app.utils.token import hash_token
+from app.utils.password_hasher import password_hasher
+from app.dependencies.principal import forget_token, forget_users
 
 SECRET_KEY = settings.JWT_SECRET_KEY
 ALGORITHM = settings.JWT_ALGORITHM
 
-bcrypt_context = CryptContext(schemes=['bcrypt'], deprecated = 'auto')
 
 #create or update user
 def create_or_update_user(user: UserCreate, db: Session):
@@ -62,6 +64,7 @@ def create_or_update_user(user: UserCreate, db: Session):
             
         db.commit()
         db.refresh(db_user)
+        forget_users(db_user.pk_id)
         
         return UserResponse(
             user_type=db_user.user_type,
@@ -77,14 +80,14 @@ def create_or_update_user(user: UserCreate, db: Session):
             updated_date=db_user.updated_date
         )
     
-    exist_email = db.query(User).filter(User.email == user.email).first()
+    exist_email = db.query(User).filter(func.lower(User.email) == user.email.lower()).first()
     if exist_email:
         raise HTTPException(status_code=400, detail="Email already exists")
     
     db_user = User(
         user_name = user.user_name,
         email = user.email,
-        password = bcrypt_context.hash(user.password),
+        password = password_hasher.hash(user.password),
         user_type = user.user_type,
         gender = user.gender,
         phone = user.phone,
@@ -127,11 +130,14 @@ def get_all_users(db: Session):
 
 # # create access token
 def create_access_token(user_id: int, expires_delta: timedelta):
+    from jose import jwt
+
     now = datetime.now(timezone.utc)
     expires = now + expires_delta
     payload = {
         "user_id": user_id,
-        "exp": expires
+        "exp": expires,
+        "jti": uuid4().hex  # two logins in the same second must not share a session digest
     }
     encoded_jwt = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
@@ -140,7 +146,7 @@ def create_access_token(user_id: int, expires_delta: timedelta):
 def create_token(ip_address: str, user_id: int, access_token: str, expiration_date: datetime, db: Session):
     token = UserSession(
         user_id = user_id,  
-        access_token = access_token,
+        token_digest = hash_token(access_token),
         token_expired=expiration_date,
         ip_address=ip_address,
     )
@@ -151,21 +157,22 @@ def create_token(ip_address: str, user_id: int, access_token: str, expiration_da
 
 # get user by email
 def get_by_email(email: str, db: Session):
-    return db.query(User).filter(User.email == email).first()
+    return db.query(User).filter(func.lower(User.email) == email.lower()).first()
 
 # # check password encript
 def verify_password(password: str, hashed_password: str):
-    isMatch = bcrypt_context.verify(password, hashed_password)
+    isMatch = password_hasher.verify(password, hashed_password)
     return isMatch
 
 # # check token when logout
 def check_token_when_logout(access_token: str, db: Session) -> bool:
     try:
-        session_token = db.query(UserSession).filter(UserSession.access_token == access_token).first()
+        session_token = db.query(UserSession).filter(UserSession.token_digest == hash_token(access_token)).first()
     
         if session_token:
             db.delete(session_token)
             db.commit()
+            forget_token(access_token)
             return True
     
         return False
@@ -178,7 +185,7 @@ def check_token_when_logout(access_token: str, db: Session) -> bool:
 def verify_refresh_token(token: str, db: Session) -> bool:
     now = datetime.now().replace(microsecond=0)
     refresh_session = db.query(UserSession).filter(
-        UserSession.access_token == token,
+        UserSession.token_digest == hash_token(token),
         UserSession.token_expired > now
     ).first()
 
@@ -195,7 +202,7 @@ def verify_refresh_token(token: str, db: Session) -> bool:
 def verify_access_token(access_token: str, db: Session):
     now = datetime.now().replace(microsecond=0)
     access_token_data = db.query(UserSession).filter(
-        UserSession.access_token == access_token,
+        UserSession.token_digest == hash_token(access_token),
         UserSession.token_expired > now
     ).first()
 
@@ -204,6 +211,31 @@ def verify_access_token(access_token: str, db: Session):
 
     return access_token_data
 
+# # delete expired sessions in small batches
+def reap_expired_sessions(db: Session, batch_size: int, max_batches: int) -> int:
+    now = datetime.now().replace(microsecond=0)
+    reaped = 0
+    for _ in range(max_batches):
+        # SKIP LOCKED: rows a refresh is extending right now are left for the next run
+        expired_ids = (
+            select(UserSession.pk_id)
+            .where(UserSession.token_expired < now)
+            .order_by(UserSession.pk_id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = db.execute(
+            delete(UserSession).where(UserSession.pk_id.in_(expired_ids)),
+            execution_options={"synchronize_session": False},
+        )
+        # Commit per batch so locks are held for one batch only
+        db.commit()
+        reaped += result.rowcount
+        if result.rowcount < batch_size:
+            break
+    return reaped
+
 #delete user
 def delete_users(db: Session, data: DeleteUser):
     if not data.ids or len(data.ids) == 0:
@@ -217,6 +249,7 @@ def delete_users(db: Session, data: DeleteUser):
     for user in users:
         user.is_active = False
     db.commit()
+    forget_users(*(user.pk_id for user in users))
     return {"message": "Users deleted successfully"}
 
 #Enable user
@@ -243,7 +276,7 @@ def change_password(db: Session, user_id: int, data: ChangePassword):
     if not verify_password(data.old_password, user.password):
         raise HTTPException(status_code=400, detail="Old password is incorrect")
 
-    user.password = bcrypt_context.hash(data.new_password)
+    user.password = password_hasher.hash(data.new_password)
     db.commit()
     return True
 
@@ -333,7 +366,7 @@ def create_or_update_user_admin(user: UserCreate, db: Session):
         if not db_user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        existing_email = db.query(User).filter(User.email == user.email).first()
+        existing_email = db.query(User).filter(func.lower(User.email) == user.email.lower()).first()
         if existing_email and existing_email.pk_id != user.pk_id:
             raise HTTPException(status_code=400, detail="Email already exists")
 
@@ -385,6 +418,7 @@ def create_or_update_user_admin(user: UserCreate, db: Session):
 
         db.commit()
         db.refresh(db_user)
+        forget_users(db_user.pk_id)
 
         return UserResponse(
             pk_id=db_user.pk_id,
@@ -403,14 +437,14 @@ def create_or_update_user_admin(user: UserCreate, db: Session):
     # ==========================
     # CREATE USER
     # ==========================
-    exist_email = db.query(User).filter(User.email == user.email).first()
+    exist_email = db.query(User).filter(func.lower(User.email) == user.email.lower()).first()
     if exist_email:
         raise HTTPException(status_code=400, detail="Email already exists")
 
     db_user = User(
         user_name=user.user_name,
         email=user.email,
-        password=bcrypt_context.hash(user.password),
+        password=password_hasher.hash(user.password),
         user_type=user.user_type,
         gender=user.gender,
         phone=user.phone,
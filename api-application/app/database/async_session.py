@@ -0,0 +1,27 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.config.settings import settings
+from app.database.pool_metrics import TimedAsyncAdaptedQueuePool, instrument_engine
+
+
+def async_database_url() -> str:
+    """ASYNC_DATABASE_URL, or DATABASE_URL pointed at the asyncpg driver"""
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    return make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+# Same pool sizing as the sync engine: each worker process holds one pool of each
+async_engine = create_async_engine(
+    async_database_url(),
+    poolclass=TimedAsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+instrument_engine(async_engine.sync_engine)
+
+# Objects stay readable after commit; lazy loads would need a greenlet hop anyway
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
@@ -0,0 +1,64 @@
+import logging
+from collections import deque
+from contextvars import ContextVar
+from sqlalchemy import event
+from app.config.settings import settings
+from app.database.session import engine, replica_engines
+from app.database.async_session import async_engine
+
+logger = logging.getLogger("app.checkout_guard")
+
+# [held now, peak] shared by every thread/task serving the current request
+_request_checkouts: ContextVar[list | None] = ContextVar("request_checkouts", default=None)
+
+# Most recent requests that held more connections at once than allowed
+violations = deque(maxlen=100)
+
+
+def _count_checkout(dbapi_connection, connection_record, connection_proxy):
+    counter = _request_checkouts.get()
+    if counter is not None:
+        counter[0] += 1
+        counter[1] = max(counter[1], counter[0])
+        # Checkin may run outside the request's context (e.g. a session closed by GC)
+        connection_record.info["request_checkouts"] = counter
+
+
+def _count_checkin(dbapi_connection, connection_record):
+    counter = connection_record.info.pop("request_checkouts", None)
+    if counter is not None:
+        counter[0] -= 1
+
+
+for guarded_engine in (engine, async_engine.sync_engine, *replica_engines):
+    event.listen(guarded_engine, "checkout", _count_checkout)
+    event.listen(guarded_engine, "checkin", _count_checkin)
+
+
+class CheckoutGuardMiddleware:
+    """
+    Tracks the most pooled connections held at once while serving each HTTP request.
+    A request should share one session (app.database.deps.get_db), so a peak above
+    DB_MAX_CHECKOUTS_PER_REQUEST means a second session held a connection alongside it.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        counter = [0, 0]
+        token = _request_checkouts.set(counter)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_checkouts.reset(token)
+            if counter[1] > settings.DB_MAX_CHECKOUTS_PER_REQUEST:
+                violation = {"method": scope["method"], "path": scope["path"], "checkouts": counter[1]}
+                violations.append(violation)
+                logger.warning(
+                    "%s %s held %d DB connections at once", scope["method"], scope["path"], counter[1]
+                )
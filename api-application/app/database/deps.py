@@ -1,8 +1,17 @@
+from fastapi import Request
 from app.database.session import SessionLocal
+from app.database.async_session import AsyncSessionLocal
+from app.database.read_routing import use_replica
 
-def get_db():
-    db = SessionLocal()
+def get_db(request: Request):
+    """The one session per request: auth, profile lookups and the handler all share it"""
+    db = SessionLocal(info={"replica": use_replica(request)})
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    """AsyncSession for `async def` routes; never mix it with get_db in one route"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,113 @@
+import threading
+import time
+from bisect import bisect_left
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# Upper bounds (ms) of the checkout wait histogram; the last bucket is open-ended
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counts = {"connects": 0, "checkouts": 0, "checkins": 0, "invalidations": 0, "timeouts": 0}
+            self._wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+            self._wait_total_ms = 0.0
+            self._wait_max_ms = 0.0
+
+    def count(self, name: str):
+        with self._lock:
+            self._counts[name] += 1
+
+    def observe_wait(self, ms: float):
+        with self._lock:
+            self._wait_buckets[bisect_left(WAIT_BUCKETS_MS, ms)] += 1
+            self._wait_total_ms += ms
+            self._wait_max_ms = max(self._wait_max_ms, ms)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            waits = sum(self._wait_buckets)
+            labels = [f"<={bound}ms" for bound in WAIT_BUCKETS_MS] + [f">{WAIT_BUCKETS_MS[-1]}ms"]
+            return {
+                **self._counts,
+                "wait": {
+                    "samples": waits,
+                    "avg_ms": round(self._wait_total_ms / waits, 3) if waits else None,
+                    "max_ms": round(self._wait_max_ms, 3),
+                    "histogram": dict(zip(labels, self._wait_buckets)),
+                },
+            }
+
+
+class _TimedCheckout:
+    """Records how long each checkout waited for a free connection"""
+
+    # One PoolMetrics per pool class, so it survives engine.dispose() recreating the pool
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.count("timeouts")
+            raise
+        finally:
+            self.metrics.observe_wait((time.perf_counter() - started) * 1000)
+        return connection
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    metrics = PoolMetrics()
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    metrics = PoolMetrics()
+
+
+def timed_pool_class(name: str) -> type:
+    """A TimedQueuePool with its own PoolMetrics, for engines that need separate numbers (replicas)"""
+    return type(f"TimedQueuePool[{name}]", (TimedQueuePool,), {"metrics": PoolMetrics()})
+
+
+def instrument_engine(engine):
+    metrics = type(engine.pool).metrics
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.count("connects")
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.count("checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        metrics.count("checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.count("invalidations")
+
+
+def pool_status(engine) -> dict:
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    metrics = getattr(pool, "metrics", None)
+    return {**status, **(metrics.snapshot() if metrics else {})}
@@ -0,0 +1,123 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import event
+from app.config.settings import settings
+from app.database.session import engine, replica_engines
+from app.database.async_session import async_engine
+
+SERVER_TIMING_PATTERN = re.compile(r'db;dur=(?P<ms>[\d.]+);desc="(?P<count>\d+) queries"')
+
+
+class QueryStats:
+    def __init__(self, scope: dict | None = None):
+        self.scope = scope
+        self.count = 0
+        self.total_ms = 0.0
+        self.statements = Counter()
+
+    def record(self, statement: str, ms: float):
+        self.count += 1
+        self.total_ms += ms
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Identical SQL run `threshold`+ times, usually a lazy load inside a loop"""
+        return [(statement, times) for statement, times in self.statements.most_common() if times >= threshold]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_ms:.1f};desc="{self.count} queries"'
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_route() -> str | None:
+    """"GET /jobs/{job_id}" for the request running this code, or None outside a request"""
+    stats = _current_stats.get()
+    if stats is None or stats.scope is None:
+        return None
+    route = stats.scope.get("route")
+    return f"{stats.scope['method']} {getattr(route, 'path', stats.scope['path'])}"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is not None and conn.info.get("query_started"):
+        started = conn.info["query_started"].pop()
+        stats.record(statement, (time.perf_counter() - started) * 1000)
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; drop its start time
+    started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument_queries(*engines):
+    for target in engines:
+        event.listen(target, "before_cursor_execute", _before_cursor_execute)
+        event.listen(target, "after_cursor_execute", _after_cursor_execute)
+        event.listen(target, "handle_error", _handle_error)
+
+
+instrument_queries(engine, async_engine.sync_engine, *replica_engines)
+
+
+@contextmanager
+def count_queries():
+    """Collect QueryStats for the enclosed block (scripts, shell sessions)"""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def assert_max_queries(budget: int):
+    with count_queries() as stats:
+        yield stats
+    if stats.count > budget:
+        raise AssertionError(f"{stats.count} queries ran, budget is {budget}")
+
+
+class QueryStatsMiddleware:
+    """
+    Counts the request's queries and warns about N+1 patterns; adds them to a
+    Server-Timing header when SERVER_TIMING_ENABLED is set
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope)
+        token = _current_stats.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start" and settings.SERVER_TIMING_ENABLED:
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing().encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            for statement, times in stats.repeated(settings.QUERY_REPEAT_WARN_THRESHOLD):
+                print(f"⚠️ N+1 suspect: {scope['method']} {scope['path']} ran this {times}x: {' '.join(statement.split())[:200]}")
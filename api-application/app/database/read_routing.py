@@ -0,0 +1,128 @@
+import threading
+import time
+from http.cookies import SimpleCookie
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from app.config.settings import settings
+from app.database.session import replica_engines
+from app.utils.cache import redis_client
+from app.utils.token import hash_token
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+STICKY_COOKIE = "read_primary_until"
+
+
+class MemoryStickyTokens:
+    """Token digest → monotonic deadline, in this worker only"""
+
+    blocking = False
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._deadlines = {}
+        self._lock = threading.Lock()
+
+    def pin(self, digest: str, seconds: float):
+        with self._lock:
+            now = time.monotonic()
+            if len(self._deadlines) >= self.max_entries:
+                for key in [key for key, deadline in self._deadlines.items() if deadline <= now]:
+                    del self._deadlines[key]
+            self._deadlines[digest] = now + seconds
+
+    def is_pinned(self, digest: str) -> bool:
+        with self._lock:
+            deadline = self._deadlines.get(digest)
+            if deadline is None:
+                return False
+            if deadline > time.monotonic():
+                return True
+            del self._deadlines[digest]
+            return False
+
+
+class RedisStickyTokens:
+    """Token digest → key that expires with the window, seen by every worker"""
+
+    blocking = True
+
+    def __init__(self, url: str, prefix: str = "sticky:"):
+        self.prefix = prefix
+        self._client = redis_client(url)
+
+    def pin(self, digest: str, seconds: float):
+        self._client.set(self.prefix + digest, 1, px=max(int(seconds * 1000), 1))
+
+    def is_pinned(self, digest: str) -> bool:
+        return bool(self._client.exists(self.prefix + digest))
+
+
+def build_sticky_tokens():
+    # A write on one worker must pin reads on all of them, so share it when there is a Redis
+    if settings.CACHE_BACKEND == "redis":
+        if not settings.CACHE_REDIS_URL:
+            raise RuntimeError("CACHE_BACKEND=redis requires CACHE_REDIS_URL")
+        return RedisStickyTokens(settings.CACHE_REDIS_URL)
+    return MemoryStickyTokens()
+
+
+# For API clients that don't keep cookies
+sticky_tokens = build_sticky_tokens()
+
+
+def _bearer_digest(authorization: str | None) -> str | None:
+    scheme, _, token = (authorization or "").partition(" ")
+    return hash_token(token) if scheme.lower() == "bearer" and token else None
+
+
+def use_replica(request: Request) -> bool:
+    """GET/HEAD reads go to a replica unless this client wrote within the stickiness window"""
+    if not replica_engines or request.method not in SAFE_METHODS:
+        return False
+
+    try:
+        if float(request.cookies.get(STICKY_COOKIE, 0)) > time.time():
+            return False
+    except ValueError:
+        pass
+
+    digest = _bearer_digest(request.headers.get("authorization"))
+    return digest is None or not sticky_tokens.is_pinned(digest)
+
+
+class ReadYourWritesMiddleware:
+    """After a successful write, pin the client to the primary for REPLICA_STICKINESS_SECONDS"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not replica_engines or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_stickiness(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                window = settings.REPLICA_STICKINESS_SECONDS
+                cookie = SimpleCookie()
+                cookie[STICKY_COOKIE] = str(time.time() + window)
+                cookie[STICKY_COOKIE]["max-age"] = window
+                cookie[STICKY_COOKIE]["path"] = "/"
+                cookie[STICKY_COOKIE]["httponly"] = True
+                # The frontend calls the API cross-origin; browsers only send SameSite=None cookies over HTTPS
+                cookie[STICKY_COOKIE]["samesite"] = "None"
+                cookie[STICKY_COOKIE]["secure"] = True
+                headers = list(message.get("headers", []))
+                headers.append((b"set-cookie", cookie[STICKY_COOKIE].OutputString().encode()))
+                message = {**message, "headers": headers}
+
+                headers_in = dict(scope.get("headers", []))
+                digest = _bearer_digest(headers_in.get(b"authorization", b"").decode("latin-1"))
+                if digest is not None:
+                    if sticky_tokens.blocking:
+                        await run_in_threadpool(sticky_tokens.pin, digest, window)
+                    else:
+                        sticky_tokens.pin(digest, window)
+            await send(message)
+
+        await self.app(scope, receive, send_with_stickiness)
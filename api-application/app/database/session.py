@@ -1,7 +1,68 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import random
+from sqlalchemy import create_engine, TextClause
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from app.config.settings import settings
+from app.database.pool_metrics import TimedQueuePool, instrument_engine, timed_pool_class
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+POOL_OPTIONS = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+
+engine = create_engine(settings.DATABASE_URL, poolclass=TimedQueuePool, **POOL_OPTIONS)
+instrument_engine(engine)
+
+# Optional read replicas. application_name shows in pg_stat_activity which engine served a query.
+replica_engines = [
+    create_engine(
+        url,
+        connect_args={"application_name": f"replica-{index}"},
+        poolclass=timed_pool_class(f"replica-{index}"),
+        **POOL_OPTIONS,
+    )
+    for index, url in enumerate(settings.DATABASE_REPLICA_URLS)
+]
+for replica_engine in replica_engines:
+    instrument_engine(replica_engine)
+
+
+def _is_replica_safe(clause) -> bool:
+    """
+    Raw SQL may write (or call a function that does) without looking like DML,
+    so text() only goes to a replica when marked .execution_options(read_only=True)
+    """
+    options = clause.get_execution_options()
+    if options.get("use_primary") or getattr(clause, "is_dml", False):
+        return False
+    if isinstance(clause, TextClause):
+        return bool(options.get("read_only"))
+    return True
+
+
+class RoutingSession(Session):
+    """
+    Sends plain reads to a replica when the session is flagged with info["replica"];
+    flushes, INSERT/UPDATE/DELETE, unmarked text() and statements marked use_primary
+    stay on the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if (
+            replica_engines
+            and self.info.get("replica")
+            and not self._flushing
+            and clause is not None
+            and _is_replica_safe(clause)
+        ):
+            if "replica_engine" not in self.info:
+                # One replica per session, so a request sees a single consistent snapshot
+                self.info["replica_engine"] = random.choice(replica_engines)
+            return self.info["replica_engine"]
+        return engine
+
+
+SessionLocal = sessionmaker(class_=RoutingSession, bind=engine, autoflush=False, autocommit=False)
 Base = declarative_base()
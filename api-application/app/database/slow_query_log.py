@@ -0,0 +1,129 @@
+import json
+import logging
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from sqlalchemy import event
+from app.config.settings import settings
+from app.database.session import engine, replica_engines
+from app.database.async_session import async_engine
+from app.database.query_stats import current_route
+
+EXPLAIN_SAVEPOINT = "slow_query_explain"
+
+# Statements EXPLAIN accepts
+EXPLAINABLE = ("SELECT", "WITH", "VALUES", "INSERT", "UPDATE", "DELETE", "MERGE")
+
+# Anything that makes running the statement again unsafe: a data-modifying CTE, row
+# locks, or functions whose effects outlive the savepoint (sequences, advisory locks)
+NOT_PLAIN_READ = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|MERGE|FOR\s+(NO\s+KEY\s+)?(UPDATE|SHARE)|FOR\s+KEY\s+SHARE"
+    r"|NEXTVAL|SETVAL|PG_ADVISORY\w*|PG_TRY_ADVISORY\w*|PG_SLEEP\w*)\b",
+    re.IGNORECASE,
+)
+
+_entries = deque(maxlen=settings.SLOW_QUERY_BUFFER_SIZE)
+_entries_lock = threading.Lock()
+
+_file_logger = None
+if settings.SLOW_QUERY_LOG_FILE:
+    _file_logger = logging.getLogger("app.slow_queries")
+    _file_logger.setLevel(logging.INFO)
+    _file_logger.propagate = False
+    _file_logger.addHandler(RotatingFileHandler(settings.SLOW_QUERY_LOG_FILE, maxBytes=5_000_000, backupCount=5))
+
+
+def redact(parameters):
+    """Keep the shape and types of bound parameters, never their values"""
+    if isinstance(parameters, dict):
+        return {key: f"<{type(value).__name__}>" for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [f"<{type(value).__name__}>" for value in parameters]
+    return None
+
+
+def is_plain_select(statement: str) -> bool:
+    """A SELECT (or read-only WITH) that can be executed a second time by EXPLAIN ANALYZE"""
+    return statement.lstrip().upper().startswith(("SELECT", "WITH")) and not NOT_PLAIN_READ.search(statement)
+
+
+def _explain(conn, statement: str, parameters) -> str | None:
+    """
+    Plan the statement on a fresh DBAPI cursor of the same connection. A savepoint keeps
+    a failed EXPLAIN out of the caller's transaction. ANALYZE executes the statement,
+    so it is only used for plain SELECTs; anything else is planned without running.
+    """
+    analyze = settings.SLOW_QUERY_EXPLAIN_ANALYZE and is_plain_select(statement)
+    prefix = "EXPLAIN (ANALYZE, BUFFERS) " if analyze else "EXPLAIN "
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(f"SAVEPOINT {EXPLAIN_SAVEPOINT}")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            plan = "\n".join(str(row[0]) for row in cursor.fetchall())
+        finally:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            cursor.execute(f"RELEASE SAVEPOINT {EXPLAIN_SAVEPOINT}")
+        return plan
+    except Exception as exc:
+        return f"EXPLAIN failed: {exc}"
+    finally:
+        cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("slow_query_started")
+    if not started:
+        return
+    duration_ms = (time.perf_counter() - started.pop()) * 1000
+    if duration_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+        return
+
+    entry = {
+        "at": datetime.now(timezone.utc).isoformat(),
+        "duration_ms": round(duration_ms, 2),
+        "route": current_route(),
+        "statement": statement,
+        "parameters": None if executemany else redact(parameters),
+        "plan": None,
+    }
+    if settings.SLOW_QUERY_EXPLAIN and not executemany and statement.lstrip().upper().startswith(EXPLAINABLE):
+        entry["plan"] = _explain(conn, statement, parameters)
+
+    with _entries_lock:
+        _entries.append(entry)
+    if _file_logger is not None:
+        _file_logger.info(json.dumps(entry, default=str))
+    print(f"🐢 {duration_ms:.0f} ms {entry['route'] or '(no request)'}: {' '.join(statement.split())[:200]}")
+
+
+def _handle_error(exception_context):
+    started = exception_context.connection.info.get("slow_query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def recent_slow_queries(limit: int | None = None) -> list[dict]:
+    with _entries_lock:
+        entries = list(_entries)
+    entries.reverse()
+    return entries[:limit] if limit else entries
+
+
+def clear_slow_queries():
+    with _entries_lock:
+        _entries.clear()
+
+
+if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+    for target in (engine, async_engine.sync_engine, *replica_engines):
+        event.listen(target, "before_cursor_execute", _before_cursor_execute)
+        event.listen(target, "after_cursor_execute", _after_cursor_execute)
+        event.listen(target, "handle_error", _handle_error)
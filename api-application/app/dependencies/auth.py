@@ -1,15 +1,9 @@
 
 from fastapi import Header, HTTPException, status, Depends
 from sqlalchemy.orm import Session
-from app.utils.token import verify_token
-from app.database.session import SessionLocal
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+from app.database.deps import get_db
+from app.enums.global_enum import UserType
+from app.dependencies.principal import CurrentPrincipal, load_principal
 
 def get_token_from_header(authorization: str | None = Header(None)) -> str:
     if authorization is None:
@@ -25,5 +19,25 @@ def get_token_from_header(authorization: str | None = Header(None)) -> str:
         )
     return token
 
-def verify_access_token(token: str = Depends(get_token_from_header), db: Session = Depends(get_db)) -> int:
-    return verify_token(token, db)
+def get_current_principal(token: str = Depends(get_token_from_header), db: Session = Depends(get_db)) -> CurrentPrincipal:
+    return load_principal(token, db)
+
+def verify_access_token(principal: CurrentPrincipal = Depends(get_current_principal)) -> int:
+    return principal.user_id
+
+def get_current_employer_id(principal: CurrentPrincipal = Depends(get_current_principal)) -> int:
+    if principal.employer_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Employer profile required"
+        )
+    return principal.employer_id
+
+
+def require_admin(principal: CurrentPrincipal = Depends(get_current_principal)) -> int:
+    if principal.user_type != int(UserType.ADMIN.value):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Administrator access required"
+        )
+    return principal.user_id
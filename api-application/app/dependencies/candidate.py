@@ -2,34 +2,30 @@
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.models.candidate_model import Candidate
-from app.dependencies.auth import verify_access_token, get_db
+from app.database.deps import get_db
+from app.dependencies.auth import get_current_principal
+from app.dependencies.principal import CurrentPrincipal
 
 
-def get_current_candidate(
-    db: Session = Depends(get_db),
-    user_id: int = Depends(verify_access_token)
-) -> Candidate:
+def get_current_candidate_id(
+    principal: CurrentPrincipal = Depends(get_current_principal)
+) -> int:
     """
-    Returns the candidate profile of the currently authenticated user.
+    Returns the candidate id of the currently authenticated user.
     Raises 403 if no candidate profile exists.
     """
-    candidate = (
-        db.query(Candidate)
-        .filter(Candidate.user_id == user_id)
-        .first()
-    )
-
-    if not candidate:
+    if principal.candidate_id is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You need to create a candidate profile first"
         )
 
-    return candidate
+    return principal.candidate_id
 
 
-def get_current_candidate_id(
-    candidate: Candidate = Depends(get_current_candidate)
-) -> int:
-    """Just returns the pk_id for simpler usage"""
-    return candidate.pk_id
\ No newline at end of file
+def get_current_candidate(
+    db: Session = Depends(get_db),
+    candidate_id: int = Depends(get_current_candidate_id)
+) -> Candidate:
+    """Loads the full candidate row when the id alone is not enough"""
+    return db.get(Candidate, candidate_id)
@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.user_model import User
+from app.models.user_session_model import UserSession
+from app.models.employer_model import Employer
+from app.models.candidate_model import Candidate
+from app.utils.cache import principal_cache, session_tag, user_tag
+from app.utils.token import hash_token, verify_token
+
+
+@dataclass(frozen=True)
+class CurrentPrincipal:
+    """Who is calling: the user plus the employer/candidate profile ids it owns"""
+    user_id: int
+    user_type: int
+    employer_id: Optional[int]
+    candidate_id: Optional[int]
+    session_expires: datetime
+
+
+def principal_stmt(digest: str, now: datetime):
+    """
+    The live session, its active user and the user's employer/candidate profile ids.
+    Always read from the primary: a lagging replica could still show a logged-out session.
+    """
+    return (
+        select(
+            User.pk_id.label("user_id"),
+            User.user_type,
+            UserSession.token_expired,
+            Employer.pk_id.label("employer_id"),
+            Candidate.pk_id.label("candidate_id"),
+        )
+        .select_from(UserSession)
+        .join(User, User.pk_id == UserSession.user_id)
+        .outerjoin(Employer, Employer.user_id == User.pk_id)
+        .outerjoin(Candidate, Candidate.user_id == User.pk_id)
+        .where(
+            UserSession.token_digest == digest,
+            UserSession.token_expired > now,
+            User.is_active.is_(True),
+        )
+        .limit(1)
+        .execution_options(use_primary=True)
+    )
+
+
+def _resolve_principal(user_id: int, row) -> CurrentPrincipal:
+    if row is None or row.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token"
+        )
+
+    return CurrentPrincipal(
+        user_id=row.user_id,
+        user_type=row.user_type,
+        employer_id=row.employer_id,
+        candidate_id=row.candidate_id,
+        session_expires=row.token_expired,
+    )
+
+
+def _cache_options(digest: str, principal: CurrentPrincipal, now: datetime) -> dict:
+    # Never serve a principal past the end of its session
+    return {
+        "tags": (user_tag(principal.user_id), session_tag(digest)),
+        "ttl": min(principal_cache.default_ttl, (principal.session_expires - now).total_seconds()),
+    }
+
+
+def load_principal(token: str, db: Session) -> CurrentPrincipal:
+    """
+    Decode the token and resolve its live session, user and profiles in one query.
+    Results are cached per token digest; logout and user changes evict them.
+    """
+    digest = hash_token(token)
+    principal = principal_cache.get(digest)
+    if principal is not None:
+        return principal
+
+    snapshot = principal_cache.snapshot()
+    user_id = verify_token(token, db)
+    now = datetime.now().replace(microsecond=0)
+    row = db.execute(principal_stmt(digest, now)).first()
+    if db.info.get("replica"):
+        # Auth runs before the handler: hand the primary connection back before its reads
+        # check out a replica one, so the request never holds two at once
+        db.rollback()
+    principal = _resolve_principal(user_id, row)
+    principal_cache.set(digest, principal, snapshot=snapshot, **_cache_options(digest, principal, now))
+    return principal
+
+
+async def load_principal_async(token: str, db: AsyncSession) -> CurrentPrincipal:
+    """load_principal for routes served by the async session; cache I/O stays off the event loop"""
+    digest = hash_token(token)
+    principal = await principal_cache.get_async(digest)
+    if principal is not None:
+        return principal
+
+    snapshot = await principal_cache.snapshot_async()
+    user_id = verify_token(token, db)
+    now = datetime.now().replace(microsecond=0)
+    row = (await db.execute(principal_stmt(digest, now))).first()
+    principal = _resolve_principal(user_id, row)
+    await principal_cache.set_async(digest, principal, snapshot=snapshot, **_cache_options(digest, principal, now))
+    return principal
+
+
+def forget_token(token: str):
+    """Evict the session everywhere: the tag only has to outlive the entries cached before it"""
+    digest = hash_token(token)
+    principal_cache.delete(digest)
+    principal_cache.invalidate(session_tag(digest), ttl=principal_cache.default_ttl)
+
+
+def forget_users(*user_ids: int):
+    principal_cache.invalidate(*(user_tag(user_id) for user_id in user_ids))
@@ -1,5 +1,10 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.database.checkout_guard import CheckoutGuardMiddleware
+from app.database.read_routing import ReadYourWritesMiddleware
+from app.database.query_stats import QueryStatsMiddleware
 from fastapi.staticfiles import StaticFiles
 from app.config.settings import settings
 import os
@@ -12,37 +17,33 @@ from app.routers import (
     candidate_resume_router,
     category_router,
     admin_candidate_router,
-    job_application_router
+    job_application_router,
+    ops_router
 )
 
-from app.database.session import Base, engine
-from app.models.user_model import User
-from app.models.user_session_model import UserSession
-from app.models.employer_model import Employer
-from app.models.job_model import Job
-from app.models.candidate_model import Candidate
-from app.models.candidate_resume_model import CandidateResume
-from app.models.category_model import Category
-from app.models.candidate_profile import CandidateProfile
-from app.models.job_application_model import JobApplication
+from app.utils.maintenance import MAINTENANCE_TASKS
+from app.utils.password_hasher import password_hasher
 
-from app.script.init_user import run as init_user
-from app.script.init_category import run as init_category
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Alembic is only imported once the app starts, never by `import app.main`.
+    # Both block on the database (and on other workers' migration lock), so keep them off the event loop.
+    if settings.RUN_MIGRATIONS_ON_STARTUP:
+        from app.script.migrate import run as run_migrations
+        await asyncio.to_thread(run_migrations)
+    else:
+        from app.script.migrate import ensure_schema_current
+        await asyncio.to_thread(ensure_schema_current)
+    for task in MAINTENANCE_TASKS:
+        task.start()
+    yield
+    for task in MAINTENANCE_TASKS:
+        task.stop()
+    password_hasher.shutdown()
 
-def create_tables():
-    """Create all tables if they don't exist"""
-    print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    print("Tables created successfully.")
 
-
-# Run once on startup
-create_tables()
-init_user()
-init_category()
-
-app = FastAPI(title=settings.APP_NAME)
+app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
 
 # app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
@@ -53,6 +54,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CheckoutGuardMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(QueryStatsMiddleware)
 
 # Configure static file serving
 UPLOAD_DIR = "uploads/employers"
@@ -68,3 +72,4 @@ app.include_router(candidate_resume_router.router)
 app.include_router(category_router.router)
 app.include_router(admin_candidate_router.router)
 app.include_router(job_application_router.router)
+app.include_router(ops_router.router)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Enum as SQLEnum, func
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Index, func, text
 from sqlalchemy.orm import relationship
 from app.database.session import Base
 import enum
@@ -11,6 +11,15 @@ class ResumeType(str, enum.Enum):
 
 class CandidateResume(Base):
     __tablename__ = "t_candidate_resume"
+    __table_args__ = (
+        Index("ix_t_candidate_resume_candidate_id", "candidate_id"),
+        # Primary-resume lookups only ever touch one row per candidate
+        Index(
+            "ix_t_candidate_resume_candidate_id_primary",
+            "candidate_id",
+            postgresql_where=text("is_primary"),
+        ),
+    )
 
     pk_id = Column(Integer, primary_key=True, autoincrement=True)
     candidate_id = Column(
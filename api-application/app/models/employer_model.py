@@ -21,6 +21,7 @@ class Employer(Base):
         Integer,
         ForeignKey("t_user.pk_id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
 
     company_name = Column(String(255), nullable=False)
@@ -38,6 +39,12 @@ class Employer(Base):
         nullable=False,
     )
 
+    updated_date = Column(
+        DateTime(timezone=True),
+        onupdate=func.now(),
+        nullable=True,
+    )
+
     # ORM relationship
     user = relationship("User", back_populates="employer")
     jobs = relationship(
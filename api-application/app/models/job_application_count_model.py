@@ -0,0 +1,49 @@
+from sqlalchemy import Column, Integer, ForeignKey, Enum as SQLEnum, DDL, event
+from app.database.session import Base
+from app.models.job_application_model import JobApplication, ApplicationStatus
+
+# Keeps t_job_application_count in step with every insert, status change, move
+# and delete on t_job_application, in the same transaction, whichever code path
+# (ORM, bulk UPDATE, upsert, FK cascade) made the change.
+APPLICATION_COUNT_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION fn_t_job_application_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND OLD.job_id = NEW.job_id AND OLD.application_status = NEW.application_status THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE t_job_application_count
+           SET total = total - 1
+         WHERE job_id = OLD.job_id AND application_status = OLD.application_status;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO t_job_application_count (job_id, application_status, total)
+        VALUES (NEW.job_id, NEW.application_status, 1)
+        ON CONFLICT (job_id, application_status)
+        DO UPDATE SET total = t_job_application_count.total + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_t_job_application_count ON t_job_application;
+CREATE TRIGGER trg_t_job_application_count
+AFTER INSERT OR DELETE OR UPDATE OF job_id, application_status ON t_job_application
+FOR EACH ROW EXECUTE FUNCTION fn_t_job_application_count();
+"""
+
+
+class JobApplicationCount(Base):
+    """Applications per (job, status); written only by the trigger above and the reconciler"""
+    __tablename__ = "t_job_application_count"
+    job_id = Column(Integer, ForeignKey("t_job.pk_id", ondelete="CASCADE"), primary_key=True)
+    application_status = Column(SQLEnum(ApplicationStatus), primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+
+
+# Databases built by create_all get the trigger too (Alembic installs it for existing ones)
+event.listen(
+    JobApplication.__table__,
+    "after_create",
+    DDL(APPLICATION_COUNT_TRIGGER_SQL).execute_if(dialect="postgresql"),
+)
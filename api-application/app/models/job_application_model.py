@@ -1,5 +1,5 @@
 # New file: models/job_application_model.py
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum as SQLEnum, func
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum as SQLEnum, UniqueConstraint, Index, func
 from sqlalchemy.orm import relationship
 from app.database.session import Base
 import enum
@@ -12,6 +12,14 @@ class ApplicationStatus(str, enum.Enum):
 
 class JobApplication(Base):
     __tablename__ = "t_job_application"
+    __table_args__ = (
+        # One application per candidate per job; also serves lookups by job_id
+        UniqueConstraint("job_id", "candidate_id", name="uq_t_job_application_job_id_candidate_id"),
+        # A candidate's applications, newest first; also serves plain candidate_id lookups
+        Index("ix_t_job_application_candidate_id_applied_date_pk_id", "candidate_id", "applied_date", "pk_id"),
+        # Keyset pages of a job's applicants, newest first
+        Index("ix_t_job_application_job_id_applied_date_pk_id", "job_id", "applied_date", "pk_id"),
+    )
     pk_id = Column(Integer, primary_key=True, autoincrement=True)
     job_id = Column(Integer, ForeignKey("t_job.pk_id", ondelete="CASCADE"), nullable=False)
     candidate_id = Column(Integer, ForeignKey("t_candidate.pk_id", ondelete="CASCADE"), nullable=False)
@@ -1,5 +1,6 @@
 from sqlalchemy import (
     Column,
+    Computed,
     Integer,
     String,
     Table,
@@ -8,9 +9,11 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Enum as SQLEnum,
+    Index,
     func,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from app.database.session import Base
 import enum
 
@@ -42,8 +45,22 @@ class JobStatus(str, enum.Enum):
     DRAFT = "Draft"
 
 
+# Weighted so title hits rank above description hits, then requirements
+JOB_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(job_title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(job_description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(experience_required, '')), 'C')"
+)
+
+
 class Job(Base):
     __tablename__ = "t_job"
+    __table_args__ = (
+        # Keyset pagination: newest-first listings seek on (created_at, pk_id)
+        Index("ix_t_job_status_created_at_pk_id", "status", "created_at", "pk_id"),
+        Index("ix_t_job_employer_id_created_at_pk_id", "employer_id", "created_at", "pk_id"),
+        Index("ix_t_job_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     pk_id = Column(Integer, primary_key=True, autoincrement=True)
     employer_id = Column(
@@ -69,12 +86,22 @@ class Job(Base):
     closing_date = Column(Date, nullable=True)
     status = Column(SQLEnum(JobStatus), default=JobStatus.DRAFT, nullable=False)
 
+    # Maintained by Postgres on every insert/update; deferred so normal loads skip it
+    search_vector = deferred(Column(TSVECTOR, Computed(JOB_SEARCH_VECTOR_SQL, persisted=True)))
+
     created_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
     )
 
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
     # Relationships
     employer = relationship("Employer", back_populates="jobs")
     applications = relationship("JobApplication", back_populates="job", cascade="all, delete-orphan")
@@ -0,0 +1,9 @@
+from sqlalchemy import Column, DateTime, String, func
+from app.database.session import Base
+
+
+class MaintenanceRun(Base):
+    """When each maintenance task last completed, shared by every worker"""
+    __tablename__ = "t_maintenance_run"
+    task_name = Column(String(64), primary_key=True)
+    last_completed_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -5,6 +5,7 @@ from sqlalchemy import (
     String,
     Date,
     Boolean,
+    Index,
     func,
     text,
 )
@@ -61,3 +62,7 @@ class User(Base):
         cascade="all, delete-orphan",
         passive_deletes=True
     )
+
+
+# Case-insensitive email lookups (login, duplicate checks)
+Index("ix_t_user_email_lower", func.lower(User.email))
@@ -1,15 +1,19 @@
 
-from sqlalchemy import Column, Integer, ForeignKey, Text, DateTime, func, String
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, func, String
 from app.database.session import Base
 from sqlalchemy.orm import relationship
 
 
 class UserSession(Base):
     __tablename__ = "t_user_session"
+    __table_args__ = (
+        Index("ux_t_user_session_token_digest", "token_digest", unique=True),
+    )
     pk_id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("t_user.pk_id", ondelete="CASCADE"), nullable=False)
-    access_token = Column(Text, nullable=False)
-    token_expired = Column(DateTime, nullable=True)
+    user_id = Column(Integer, ForeignKey("t_user.pk_id", ondelete="CASCADE"), nullable=False, index=True)
+    # sha256 hex of the JWT (see app.utils.token.hash_token); the token itself is never stored
+    token_digest = Column(String(64), nullable=False)
+    token_expired = Column(DateTime, nullable=True, index=True)
     session_creation_date = Column(DateTime, default=func.now(), nullable=False)
     ip_address = Column(String, nullable=True)
     device_info = Column(String, nullable=True)
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, func, select
+from sqlalchemy.orm import Session, aliased
 from app.database.deps import get_db
 from app.dependencies.auth import verify_access_token
 from app.models.candidate_model import Candidate
@@ -16,30 +17,34 @@ UPLOAD_FOLDER = "uploads/resumes"
 @router.get("/candidates")
 def get_all_candidates(db: Session = Depends(get_db), current_user_id: int = Depends(verify_access_token)):
 
+    # Primary resume joined in the same query instead of one lookup per candidate
+    PrimaryResume = aliased(CandidateResume, name="primary_resume")
+    primary_resume_id = (
+        select(func.min(CandidateResume.pk_id))
+        .where(
+            CandidateResume.candidate_id == Candidate.pk_id,
+            CandidateResume.is_primary == True
+        )
+        .correlate(Candidate)
+        .scalar_subquery()
+    )
     candidates = (
         db.query(
             Candidate.pk_id.label("candidate_id"),
             User.user_name,
             User.email,
             Candidate.status,
+            PrimaryResume,
         )
         .join(User, User.pk_id == Candidate.user_id)
-        .join(CandidateResume, CandidateResume.candidate_id == Candidate.pk_id)
-        .group_by(Candidate.pk_id, User.user_name, User.email, Candidate.status)
+        .outerjoin(PrimaryResume, PrimaryResume.pk_id == primary_resume_id)
+        .filter(exists().where(CandidateResume.candidate_id == Candidate.pk_id))
         .all()
     )
 
     result = []
     for c in candidates:
-        # Get primary resume for created_date and file info
-        primary_resume = (
-            db.query(CandidateResume)
-            .filter(
-                CandidateResume.candidate_id == c.candidate_id,
-                CandidateResume.is_primary == True
-            )
-            .first()
-        )
+        primary_resume = c.primary_resume
 
         # Format the datetime to "YYYY-MM-DD HH:MM"
         formatted_date = (
@@ -1,8 +1,7 @@
 import os
-from weasyprint import HTML
+from functools import lru_cache
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form
 from fastapi.responses import FileResponse
-from jinja2 import Environment, FileSystemLoader
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.dependencies.auth import verify_access_token
@@ -21,6 +20,14 @@ from app.controllers.candidate_resume_controller import (
 
 router = APIRouter(prefix="/candidate/resumes", tags=["Candidate Resumes"])
 
+
+@lru_cache(maxsize=1)
+def cv_template_env():
+    # jinja2 and weasyprint are only needed to render CVs; keep them out of worker startup
+    from jinja2 import Environment, FileSystemLoader
+    return Environment(loader=FileSystemLoader("cv_template"))
+
+
 @router.post("/", response_model=ResumeOut)
 def create_candidate_resume(
     resume_type: str = Form(...),
@@ -136,7 +143,8 @@ def download_resume(
 
 @router.get("/generate-cv/{template_id}/{candidate_id}")
 def generate_cv(template_id: str, candidate_id: int = Depends(get_current_candidate_id), db: Session = Depends(get_db)):
-    env = Environment(loader=FileSystemLoader("cv_template"))
+    from weasyprint import HTML
+
     TEMPLATE_MAP = {
         "modern-minimal": "modern_minimal.html",
         "creative-designer": "creative_designer.html",
@@ -166,9 +174,8 @@ def generate_cv(template_id: str, candidate_id: int = Depends(get_current_candid
     }
 
     # Load HTML template
-    env = Environment(loader=FileSystemLoader("cv_template"))
     template_file = TEMPLATE_MAP[template_id]
-    template = env.get_template(template_file)
+    template = cv_template_env().get_template(template_file)
     html_content = template.render(user=user_data)
 
     # Generate PDF
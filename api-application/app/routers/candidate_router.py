@@ -1,7 +1,8 @@
 import re
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from app.dependencies.auth import verify_access_token, get_db
+from app.database.deps import get_db
+from app.dependencies.auth import verify_access_token
 from app.models.candidate_model import Candidate
 from app.models.candidate_profile import CandidateProfile
 from app.schemas.candidate_schema import CandidateCreate, CandidateOut, CandidateProfileUpdate
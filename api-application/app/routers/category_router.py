@@ -1,13 +1,30 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.models.category_model import Category
 from app.schemas.job_schema import CategoryBasic as CategoryOut
-from app.dependencies.auth import get_db
+from app.database.deps import get_async_db
+from app.utils.cache import response_cache, render_json, CATEGORIES_TAG
+from app.utils.conditional import body_etag, is_not_modified, not_modified_response, validator_headers
 
 router = APIRouter(prefix="/categories", tags=["Categories"])
 
+CATEGORY_LIST_ADAPTER = TypeAdapter(List[CategoryOut])
+
 
 @router.get("/", response_model=List[CategoryOut])
-def get_all_categories(db: Session = Depends(get_db)):
-    return db.query(Category).order_by(Category.name).all()
\ No newline at end of file
+async def get_all_categories(request: Request, db: AsyncSession = Depends(get_async_db)):
+    body = await response_cache.get_async("categories:list")
+    if body is None:
+        snapshot = await response_cache.snapshot_async()
+        categories = (await db.scalars(select(Category).order_by(Category.name))).all()
+        body = render_json(CATEGORY_LIST_ADAPTER, categories)
+        await response_cache.set_async("categories:list", body, tags=(CATEGORIES_TAG,), snapshot=snapshot)
+
+    # t_category has no timestamp column, so validate on the rendered body
+    etag = body_etag(body)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    return Response(content=body, media_type="application/json", headers=validator_headers(etag))
\ No newline at end of file
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.dependencies.auth import verify_access_token
 
 from app.database.deps import get_db
 from app.schemas.employer_schema import EmployerCreate, EmployerUpdate, EmployerOut, UserProfileEmployer, UserUpdateProfile
-from app.controllers.employer_controller import create_employer, get_employer, get_employers, update_employer, delete_employer, get_employer_profiles, update_profile_employer
+from app.controllers.employer_controller import create_employer, get_employer, get_employers, update_employer, delete_employer, get_employer_profiles, update_profile_employer, get_employer_detail
+from app.utils.conditional import weak_etag, is_not_modified, not_modified_response, set_validators
 
 router = APIRouter(prefix="/employer", tags=["Employers"])
 
@@ -37,10 +38,27 @@ def api_get_employers(db: Session = Depends(get_db), current_user_id: int = Depe
     return get_employers(db)
 
 @router.get("/{employer_id}", response_model=EmployerOut)
-def api_get_employer(employer_id: int, db: Session = Depends(get_db), current_user_id: int = Depends(verify_access_token)):
-    db_employer = get_employer(db, employer_id)
+def api_get_employer(
+    employer_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(verify_access_token)
+):
+    db_employer = get_employer_detail(db, employer_id)
     if not db_employer:
         raise HTTPException(status_code=404, detail="Employer not found")
+
+    employer_version = db_employer["updated_date"] or db_employer["created_date"]
+    jobs_updated_at = db_employer.pop("jobs_updated_at")
+    last_modified = max(employer_version, jobs_updated_at) if jobs_updated_at else employer_version
+    etag = weak_etag("employer", employer_id, employer_version.isoformat(), db_employer["job_count"])
+    # A deleted job leaves no timestamp behind, so only the ETag (which carries job_count) can
+    # validate this body; If-Modified-Since alone would answer 304 after a job is removed.
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, last_modified, "private, no-cache")
+
+    set_validators(response, etag, last_modified, "private, no-cache")
     return db_employer
 
 @router.put("/{employer_id}", response_model=EmployerOut)
@@ -1,23 +1,42 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
-from typing import List
-from app.dependencies.auth import verify_access_token, get_db
+from typing import Dict, List, Optional
+from datetime import datetime
+import mimetypes
+import os
+from app.database.deps import get_db
+from app.dependencies.auth import get_current_employer_id
 from app.dependencies.candidate import get_current_candidate_id
-from app.models.employer_model import Employer
-from app.models.job_application_model import JobApplication
+from app.models.job_application_model import JobApplication, ApplicationStatus
 from app.schemas.job_application_schema import (
     JobApplicationCreate,
     JobApplicationOut,
-    ApplicationOutForEmployer
+    ApplicationOutForEmployer,
+    BulkStatusUpdate,
+    BulkStatusResult,
+    JobPipelineOut,
+    ApplicantPage,
+    MyApplicationStatus,
+    MAX_STATUS_JOB_IDS,
+    MyApplicationPage
 )
 from app.controllers.job_application_controller import (
     apply_to_job,
     get_applications_for_job,
-    update_application_status
+    update_application_status,
+    bulk_update_application_status,
+    get_application_pipeline,
+    get_applications_for_job_page,
+    get_application_resume_file,
+    get_my_application_statuses,
+    get_my_applications_page
 )
 
 router = APIRouter(prefix="/applications", tags=["Applications"])
 
+RESUME_UPLOAD_FOLDER = "uploads/resumes"
+
 # ─── Candidate side ──────────────────────────────────────────────────────────
 
 @router.post("/", response_model=JobApplicationOut, status_code=201)
@@ -34,34 +53,101 @@ def apply_to_job_endpoint(
         reset_status_on_reapply=True,
     )
 
+@router.get("/mine", response_model=MyApplicationPage)
+def list_my_applications(
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    status: Optional[List[ApplicationStatus]] = Query(None, description="Repeat to match several statuses"),
+    db: Session = Depends(get_db),
+    candidate_id: int = Depends(get_current_candidate_id)
+):
+    """The candidate's own applications, newest first, with job, company and resume details"""
+    return get_my_applications_page(db, candidate_id, limit, cursor, statuses=status)
+
+@router.get("/my-status", response_model=Dict[int, MyApplicationStatus])
+def get_my_application_statuses_batch(
+    job_ids: List[int] = Query(..., max_length=MAX_STATUS_JOB_IDS, description="Repeat for each job"),
+    db: Session = Depends(get_db),
+    candidate_id: int = Depends(get_current_candidate_id)
+):
+    """Application status for many jobs in one query; jobs not applied to map to applied=false"""
+    return get_my_application_statuses(db, candidate_id, job_ids)
+
 # ─── Employer side ───────────────────────────────────────────────────────────
 
+@router.get("/pipeline", response_model=List[JobPipelineOut])
+def application_pipeline(
+    db: Session = Depends(get_db),
+    employer_id: int = Depends(get_current_employer_id)
+):
+    return get_application_pipeline(db, employer_id)
+
 @router.get("/job/{job_id}", response_model=List[ApplicationOutForEmployer])
 def list_job_applications(
     job_id: int,
     skip: int = 0,
     limit: int = 20,
     db: Session = Depends(get_db),
-    current_user_id: int = Depends(verify_access_token)
+    employer_id: int = Depends(get_current_employer_id)
 ):
-    employer = db.query(Employer).filter(Employer.user_id == current_user_id).first()
-    if not employer:
-        raise HTTPException(403, "Employer profile required")
+    return get_applications_for_job(db, job_id, employer_id, skip, limit)
 
-    return get_applications_for_job(db, job_id, employer.pk_id, skip, limit)
+@router.get("/job/{job_id}/page", response_model=ApplicantPage)
+def list_job_applications_page(
+    job_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    status: Optional[List[ApplicationStatus]] = Query(None, description="Repeat to match several statuses"),
+    applied_from: Optional[datetime] = Query(None, description="Inclusive lower bound on applied_date"),
+    applied_to: Optional[datetime] = Query(None, description="Exclusive upper bound on applied_date"),
+    include_content: bool = Query(False, description="Also return resume text, recommendation letter and candidate bio"),
+    db: Session = Depends(get_db),
+    employer_id: int = Depends(get_current_employer_id)
+):
+    return get_applications_for_job_page(
+        db, job_id, employer_id, limit, cursor,
+        statuses=status,
+        applied_from=applied_from,
+        applied_to=applied_to,
+        include_content=include_content,
+    )
+
+@router.get("/{application_id}/resume-file")
+def download_application_resume(
+    application_id: int,
+    db: Session = Depends(get_db),
+    employer_id: int = Depends(get_current_employer_id)
+):
+    """The uploaded resume an applicant sent, for the employer who owns the job"""
+    resume_file = get_application_resume_file(db, application_id, employer_id)
+
+    file_path = os.path.join(RESUME_UPLOAD_FOLDER, resume_file)
+    if not os.path.exists(file_path):
+        raise HTTPException(status_code=404, detail="File not found")
+
+    mime_type, _ = mimetypes.guess_type(file_path)
+    return FileResponse(
+        path=file_path,
+        filename=resume_file,
+        media_type=mime_type or "application/octet-stream"
+    )
+
+@router.patch("/status", response_model=BulkStatusResult)
+def bulk_update_status(
+    data: BulkStatusUpdate,
+    db: Session = Depends(get_db),
+    employer_id: int = Depends(get_current_employer_id)
+):
+    return bulk_update_application_status(db, data.application_ids, data.new_status, employer_id)
 
 @router.patch("/{application_id}/status")
 def update_status(
     application_id: int,
     new_status: str,  # You can also use Body(embed=True) + a small schema
     db: Session = Depends(get_db),
-    current_user_id: int = Depends(verify_access_token)
+    employer_id: int = Depends(get_current_employer_id)
 ):
-    employer = db.query(Employer).filter(Employer.user_id == current_user_id).first()
-    if not employer:
-        raise HTTPException(403, "Employer profile required")
-
-    updated = update_application_status(db, application_id, new_status, employer.pk_id)
+    updated = update_application_status(db, application_id, new_status, employer_id)
     return {"message": f"Application status updated to {updated.application_status}"}
 
 @router.get("/job/{job_id}/my-status")
@@ -1,16 +1,85 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from typing import List
-from app.dependencies.auth import verify_access_token, get_db
-from app.schemas.job_schema import JobCreate, JobUpdate, JobOut
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.database.deps import get_db, get_async_db
+from app.dependencies.auth import verify_access_token, get_current_principal, get_current_employer_id, get_token_from_header
+from app.dependencies.principal import CurrentPrincipal, load_principal_async
+from app.schemas.job_schema import (
+    JobCreate, JobUpdate, JobOut, JobOutWithMyStatus, JobPage, JobSearchFilters, JobFacetsOut,
+    JobSummaryOut, JobSummaryPage
+)
 from app.controllers.job_controller import (
-    create_job, get_job, get_jobs_by_employer,
-    update_job, delete_job, get_all_active_jobs
+    create_job, get_job_async, get_jobs_by_employer,
+    update_job, delete_job, get_all_active_jobs_async,
+    get_active_jobs_page, get_jobs_by_employer_page,
+    search_jobs, get_job_facets, get_active_job_summaries_page
 )
-from app.models.employer_model import Employer
+from app.controllers.job_application_controller import get_my_application_statuses_async
+from app.schemas.job_application_schema import MyApplicationStatus
+from app.models.job_model import JobLevel, JobType, JobStatus
+from app.utils.cache import response_cache, render_json, JOBS_TAG, job_tag, employer_tag
+from app.utils.conditional import weak_etag, is_not_modified, not_modified_response, validator_headers
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
+JOB_ADAPTER = TypeAdapter(JobOut)
+JOB_LIST_ADAPTER = TypeAdapter(List[JobOut])
+JOB_PAGE_ADAPTER = TypeAdapter(JobPage)
+JOB_SUMMARY_PAGE_ADAPTER = TypeAdapter(JobSummaryPage)
+JOB_LIST_WITH_STATUS_ADAPTER = TypeAdapter(List[JobOutWithMyStatus])
+
+
+def job_list_tags(jobs) -> list[str]:
+    """A cached listing depends on every job and employer shown in it"""
+    tags = {JOBS_TAG}
+    for job in jobs:
+        if isinstance(job, dict):
+            job_id, employer_id = job["pk_id"], job["employer_id"]
+        else:
+            job_id, employer_id = job.pk_id, job.employer_id
+        tags.add(job_tag(job_id))
+        tags.add(employer_tag(employer_id))
+    return sorted(tags)
+
+
+def json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def parse_sparse_fields(fields: Optional[str]) -> Optional[set[str]]:
+    """`fields=job_title,location` -> the JobSummaryOut fields to emit (pk_id is always kept)"""
+    if not fields:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(JobSummaryOut.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return requested | {"pk_id"}
+
+
+def get_job_search_filters(
+    q: Optional[str] = Query(None, max_length=200, description="Words to match in title, description and requirements"),
+    job_type: Optional[JobType] = None,
+    level: Optional[JobLevel] = None,
+    category_id: Optional[int] = None,
+    location: Optional[str] = Query(None, max_length=255),
+    status: JobStatus = JobStatus.OPEN,
+) -> JobSearchFilters:
+    return JobSearchFilters(
+        q=q.strip() if q else None,
+        job_type=job_type,
+        level=level,
+        category_id=category_id,
+        location=location,
+        status=status,
+    )
+
 
 @router.post("/", response_model=JobOut, status_code=status.HTTP_201_CREATED)
 def create_new_job(
@@ -28,30 +97,151 @@ def get_my_jobs(
     skip: int = 0,
     limit: int = 20,
     db: Session = Depends(get_db),
-    current_user_id: int = Depends(verify_access_token)
+    principal: CurrentPrincipal = Depends(get_current_principal)
 ):
-    employer = db.query(Employer).filter(Employer.user_id == current_user_id).first()
-    if not employer:
+    if principal.employer_id is None:
         return []  # or raise 403 / 404 depending on your logic
-    return get_jobs_by_employer(db, employer.pk_id, skip, limit)
+    return get_jobs_by_employer(db, principal.employer_id, skip, limit)
+
+
+@router.get("/my-jobs/page", response_model=JobPage)
+def get_my_jobs_page(
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    principal: CurrentPrincipal = Depends(get_current_principal)
+):
+    if principal.employer_id is None:
+        return JobPage(items=[])
+    return get_jobs_by_employer_page(db, principal.employer_id, limit, cursor)
+
+
+@router.get("/page", response_model=JobPage)
+def get_public_active_jobs_page(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """Public endpoint - Open jobs with opaque next/prev cursors"""
+    cache_key = f"jobs:page:{cursor}:{limit}"
+    body = response_cache.get(cache_key)
+    if body is None:
+        snapshot = response_cache.snapshot()
+        page = get_active_jobs_page(db, limit, cursor)
+        body = render_json(JOB_PAGE_ADAPTER, page)
+        response_cache.set(cache_key, body, tags=job_list_tags(page["items"]), snapshot=snapshot)
+    return json_response(body)
+
+
+@router.get("/summary", response_model=JobSummaryPage)
+def get_public_job_summaries(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated JobSummaryOut fields to return"),
+    db: Session = Depends(get_db)
+):
+    """Public endpoint - Open jobs as light list cards, optionally trimmed to `fields`"""
+    selected = parse_sparse_fields(fields)
+    cache_key = f"jobs:summary:{cursor}:{limit}:{','.join(sorted(selected)) if selected else '*'}"
+    body = response_cache.get(cache_key)
+    if body is None:
+        snapshot = response_cache.snapshot()
+        page = get_active_job_summaries_page(
+            db, limit, cursor,
+            with_categories=selected is None or "categories" in selected,
+        )
+        include = {"items": {"__all__": selected}, "next_cursor": True, "prev_cursor": True} if selected else None
+        body = JOB_SUMMARY_PAGE_ADAPTER.dump_json(
+            JOB_SUMMARY_PAGE_ADAPTER.validate_python(page),
+            include=include,
+        )
+        response_cache.set(cache_key, body, tags=job_list_tags(page["items"]), snapshot=snapshot)
+    return json_response(body)
+
+
+@router.get("/search", response_model=List[JobOut])
+def search_public_jobs(
+    filters: JobSearchFilters = Depends(get_job_search_filters),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """Public endpoint - full-text search with type/level/category/location/status filters"""
+    return search_jobs(db, filters, skip, limit)
+
+
+@router.get("/facets", response_model=JobFacetsOut)
+def get_public_job_facets(
+    filters: JobSearchFilters = Depends(get_job_search_filters),
+    db: Session = Depends(get_db)
+):
+    """Public endpoint - sidebar counts per type, level, category and location"""
+    return get_job_facets(db, filters)
 
 
 @router.get("/{job_id}", response_model=JobOut)
-def get_single_job(job_id: int, db: Session = Depends(get_db)):
-    job = get_job(db, job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    return job
+async def get_single_job(job_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    cache_key = f"jobs:detail:{job_id}"
+    cached = await response_cache.get_async(cache_key)
+    if cached is None:
+        snapshot = await response_cache.snapshot_async()
+        job = await get_job_async(db, job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        # The body embeds the employer, so its version is part of the validator too
+        employer_version = job.employer.updated_date or job.employer.created_date
+        last_modified = max(job.updated_at or job.created_at, employer_version)
+        etag = weak_etag("job", job.pk_id, job.updated_at or job.created_at, employer_version)
+        # Stored as (bytes, str, str) so every cache backend can hold it without pickling
+        cached = (render_json(JOB_ADAPTER, job), etag, last_modified.isoformat())
+        await response_cache.set_async(cache_key, cached, tags=(job_tag(job.pk_id), employer_tag(job.employer_id)), snapshot=snapshot)
+
+    body, etag, last_modified = cached
+    last_modified = datetime.fromisoformat(last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    return Response(content=body, media_type="application/json", headers=validator_headers(etag, last_modified))
+
+
+async def embed_my_application_status(body: bytes, authorization: str, db: AsyncSession) -> Response:
+    """
+    Add `my_application` to every job of a cached listing for the calling candidate.
+    The shared cached body stays anonymous; only this per-user copy carries statuses.
+    A missing, bad or expired token just gets the anonymous listing.
+    """
+    try:
+        principal = await load_principal_async(get_token_from_header(authorization), db)
+    except HTTPException:
+        return json_response(body)
+    if principal.candidate_id is None:
+        return json_response(body)
+
+    jobs = JOB_LIST_WITH_STATUS_ADAPTER.validate_json(body)
+    statuses = await get_my_application_statuses_async(db, principal.candidate_id, [job.pk_id for job in jobs])
+    for job in jobs:
+        job.my_application = MyApplicationStatus.model_validate(statuses[job.pk_id])
+    return json_response(JOB_LIST_WITH_STATUS_ADAPTER.dump_json(jobs))
 
 
 @router.get("/", response_model=List[JobOut])
-def get_public_active_jobs(
+async def get_public_active_jobs(
     skip: int = 0,
     limit: int = 50,
-    db: Session = Depends(get_db)
+    with_my_status: bool = Query(False, description="With a candidate's bearer token, embed my_application in each job"),
+    authorization: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Public endpoint - shows only Open jobs"""
-    return get_all_active_jobs(db, skip, limit)
+    cache_key = f"jobs:list:{skip}:{limit}"
+    body = await response_cache.get_async(cache_key)
+    if body is None:
+        snapshot = await response_cache.snapshot_async()
+        jobs = await get_all_active_jobs_async(db, skip, limit)
+        body = render_json(JOB_LIST_ADAPTER, jobs)
+        await response_cache.set_async(cache_key, body, tags=job_list_tags(jobs), snapshot=snapshot)
+    if with_my_status and authorization:
+        return await embed_my_application_status(body, authorization, db)
+    return json_response(body)
 
 
 @router.put("/{job_id}", response_model=JobOut)
@@ -59,13 +249,9 @@ def update_existing_job(
     job_id: int,
     job_data: JobUpdate,
     db: Session = Depends(get_db),
-    current_user_id: int = Depends(verify_access_token)
+    employer_id: int = Depends(get_current_employer_id)
 ):
-    employer = db.query(Employer).filter(Employer.user_id == current_user_id).first()
-    if not employer:
-        raise HTTPException(403, "You don't have an employer profile")
-
-    updated_job = update_job(db, job_id, job_data, employer.pk_id)  
+    updated_job = update_job(db, job_id, job_data, employer_id)
     if not updated_job:
         raise HTTPException(404, "Job not found or not yours")
     return updated_job
@@ -74,9 +260,9 @@ def update_existing_job(
 def delete_existing_job(
     job_id: int,
     db: Session = Depends(get_db),
-    current_user_id: int = Depends(verify_access_token)
+    employer_id: int = Depends(get_current_employer_id)
 ):
-    deleted_job = delete_job(db, job_id, current_user_id)
+    deleted_job = delete_job(db, job_id, employer_id)
     if not deleted_job:
         raise HTTPException(status_code=404, detail="Job not found or not yours")
     return deleted_job
\ No newline at end of file
@@ -0,0 +1,71 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.dependencies.auth import require_admin
+from app.database.session import engine, replica_engines
+from app.database.async_session import async_engine
+from app.database.pool_metrics import pool_status
+from app.database.slow_query_log import recent_slow_queries, clear_slow_queries
+from app.utils.cache import response_cache
+from app.utils.maintenance import MAINTENANCE_TASKS
+from app.utils.password_hasher import password_hasher
+
+router = APIRouter(prefix="/ops", tags=["Ops"])
+
+
+@router.get("/cache")
+def get_cache_stats(current_user_id: int = Depends(require_admin)):
+    return response_cache.stats()
+
+
+@router.delete("/cache")
+def clear_cache(current_user_id: int = Depends(require_admin)):
+    response_cache.clear()
+    return {"message": "Cache cleared"}
+
+
+@router.get("/maintenance")
+def get_maintenance_stats(current_user_id: int = Depends(require_admin)):
+    return [task.stats() for task in MAINTENANCE_TASKS]
+
+
+@router.post("/maintenance/{task_name}/run")
+def run_maintenance_task(task_name: str, current_user_id: int = Depends(require_admin)):
+    for task in MAINTENANCE_TASKS:
+        if task.name == task_name:
+            task.run_once(manual=True)
+            return task.stats()
+    raise HTTPException(status_code=404, detail="Maintenance task not found")
+
+
+@router.get("/password-hasher")
+def get_password_hasher_stats(current_user_id: int = Depends(require_admin)):
+    return password_hasher.stats()
+
+
+@router.get("/db-pool")
+def get_db_pool_stats(current_user_id: int = Depends(require_admin)):
+    return pool_status(engine)
+
+
+@router.get("/db-pool/replicas")
+def get_replica_db_pool_stats(current_user_id: int = Depends(require_admin)):
+    return [pool_status(replica_engine) for replica_engine in replica_engines]
+
+
+@router.get("/db-pool/async")
+def get_async_db_pool_stats(current_user_id: int = Depends(require_admin)):
+    return pool_status(async_engine.sync_engine)
+
+
+@router.get("/slow-queries")
+def get_slow_queries(
+    limit: Optional[int] = Query(None, ge=1),
+    current_user_id: int = Depends(require_admin)
+):
+    return recent_slow_queries(limit)
+
+
+@router.delete("/slow-queries")
+def delete_slow_queries(current_user_id: int = Depends(require_admin)):
+    clear_slow_queries()
+    return {"message": "Slow query log cleared"}
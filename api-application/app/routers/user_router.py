@@ -1,18 +1,17 @@
 
-from fastapi import APIRouter, Depends, Request, HTTPException, Body, Header
+from fastapi import APIRouter, Depends, Request, Response, HTTPException, Body, Header
 from sqlalchemy.orm import Session
 from app.schemas.user_schema import JobOut
 from app.schemas.user_schema import UserCreate, DeleteUser, AccessToken, UserLogin, UserResponse, ChangePassword, ResponseUserProfile, UpdateUserProfile
 from app.controllers import user_controller
 from typing import List
-from passlib.context import CryptContext
 from datetime import timedelta, datetime
 from app.dependencies.auth import verify_access_token
 from app.database.deps import get_db
+from app.utils.conditional import weak_etag, is_not_modified, not_modified_response, set_validators
 
 
 router = APIRouter(prefix="/user", tags=["Users"])
-bcrypt_context = CryptContext(schemes=['bcrypt'], deprecated = 'auto')
 
 
 # user login for get token
@@ -116,8 +115,23 @@ def change_password(data: ChangePassword, db: Session = Depends(get_db), current
 
 #get user by id
 @router.get("/profile", response_model=ResponseUserProfile)
-def get_user_by_id(db: Session = Depends(get_db), current_user_id: int = Depends(verify_access_token)):
-    return user_controller.get_user_by_id(db, current_user_id)
+def get_user_by_id(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(verify_access_token)
+):
+    user = user_controller.get_user_by_id(db, current_user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    last_modified = user.updated_date or user.created_date
+    etag = weak_etag("user", user.pk_id, last_modified.isoformat())
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified, "private, no-cache")
+
+    set_validators(response, etag, last_modified, "private, no-cache")
+    return user
 
 
 #update user profile
@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, computed_field
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Literal, Optional
 from app.models.job_application_model import ApplicationStatus
+from app.models.job_model import JobStatus
+from app.models.candidate_resume_model import ResumeType
 
 class JobApplicationCreate(BaseModel):
     job_id: int
@@ -43,4 +45,110 @@ class ApplicationOutForEmployer(BaseModel):
     resume: Optional[ResumeBasicOut]
     applied_date: datetime
     application_status: ApplicationStatus
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+# ────────────────────────────────────────────────
+# Bulk status change (EMPLOYER screening)
+# ────────────────────────────────────────────────
+class BulkStatusUpdate(BaseModel):
+    application_ids: List[int] = Field(..., min_length=1, max_length=1000)
+    new_status: ApplicationStatus
+
+class BulkStatusItem(BaseModel):
+    application_id: int
+    result: Literal["updated", "not_found"]
+
+class BulkStatusResult(BaseModel):
+    new_status: ApplicationStatus
+    updated: int
+    not_found: int
+    results: List[BulkStatusItem]
+
+
+# ────────────────────────────────────────────────
+# Employer dashboard: applications per status per job
+# ────────────────────────────────────────────────
+class JobPipelineOut(BaseModel):
+    job_id: int
+    job_title: str
+    job_status: JobStatus
+    counts: Dict[str, int]
+    total: int
+
+
+# ────────────────────────────────────────────────
+# Employer applicant list: keyset page, no large text unless include_content
+# ────────────────────────────────────────────────
+class ApplicantListItem(BaseModel):
+    pk_id: int
+    job_id: int
+    candidate_id: int
+    candidate_user_id: int
+    candidate_name: str
+    candidate_resume_id: Optional[int] = None
+    resume_type: Optional[ResumeType] = None
+    resume_file: Optional[str] = None
+    applied_date: datetime
+    application_status: ApplicationStatus
+    # Only filled when the page is requested with include_content=true
+    candidate_description: Optional[str] = None
+    resume_content: Optional[str] = None
+    recommendation_letter: Optional[str] = None
+
+    @computed_field
+    @property
+    def download_url(self) -> Optional[str]:
+        # Employer-side route: checks the application belongs to one of the employer's jobs
+        if self.resume_file and self.resume_type == ResumeType.UPLOAD:
+            return f"/applications/{self.pk_id}/resume-file"
+        return None
+
+class ApplicantPage(BaseModel):
+    items: List[ApplicantListItem]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+# ────────────────────────────────────────────────
+# Candidate: "did I apply?" for many jobs at once
+# ────────────────────────────────────────────────
+MAX_STATUS_JOB_IDS = 100
+
+class MyApplicationStatus(BaseModel):
+    applied: bool
+    application_id: Optional[int] = None
+    status: Optional[ApplicationStatus] = None
+    resume_id: Optional[int] = None
+    applied_date: Optional[datetime] = None
+
+
+# ────────────────────────────────────────────────
+# Candidate: own applications, keyset paged
+# ────────────────────────────────────────────────
+class MyApplicationItem(BaseModel):
+    pk_id: int
+    job_id: int
+    job_title: str
+    job_status: JobStatus
+    employer_id: int
+    company_name: str
+    company_logo: Optional[str] = None
+    application_status: ApplicationStatus
+    applied_date: datetime
+    candidate_resume_id: Optional[int] = None
+    resume_type: Optional[ResumeType] = None
+    resume_file: Optional[str] = None
+
+    @computed_field
+    @property
+    def resume_label(self) -> Optional[str]:
+        if self.resume_type is None:
+            return None
+        if self.resume_type == ResumeType.UPLOAD and self.resume_file:
+            return self.resume_file
+        return f"{self.resume_type.value} resume"
+
+class MyApplicationPage(BaseModel):
+    items: List[MyApplicationItem]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
@@ -2,6 +2,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from datetime import datetime
 from app.models.job_model import JobLevel, JobType, JobStatus
+from app.schemas.job_application_schema import MyApplicationStatus
 
 
 class JobCreate(BaseModel):
@@ -31,6 +32,15 @@ class JobUpdate(BaseModel):
     closing_date: Optional[datetime] = None
     status: Optional[JobStatus] = None
 
+class JobSearchFilters(BaseModel):
+    q: Optional[str] = None
+    job_type: Optional[JobType] = None
+    level: Optional[JobLevel] = None
+    category_id: Optional[int] = None
+    location: Optional[str] = None
+    status: JobStatus = JobStatus.OPEN
+
+
 class EmployerBasic(BaseModel):
     pk_id: int
     company_name: str
@@ -67,5 +77,60 @@ class JobOut(BaseModel):
     closing_date: Optional[datetime]
     status: JobStatus
     created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
+class JobOutWithMyStatus(JobOut):
+    """JobOut plus the calling candidate's application, for GET /jobs/?with_my_status=true"""
+    my_application: Optional[MyApplicationStatus] = None
+
+
+class JobPage(BaseModel):
+    items: List[JobOut]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+
+class FacetCount(BaseModel):
+    value: Optional[str] = None
+    pk_id: Optional[int] = None
+    count: int
+
+
+class JobFacetsOut(BaseModel):
+    total: int
+    job_type: List[FacetCount] = []
+    level: List[FacetCount] = []
+    category: List[FacetCount] = []
+    location: List[FacetCount] = []
+
+
+
+class JobSummaryOut(BaseModel):
+    """List-card projection: no full description/requirements, no nested employer profile"""
+    pk_id: int
+    employer_id: int
+    company_name: str
+    company_logo: Optional[str] = None
+    job_title: str
+    job_type: JobType
+    level: JobLevel
+    categories: List[CategoryBasic] = []
+    salary_range: Optional[str] = None
+    location: Optional[str] = None
+    description_snippet: Optional[str] = None
+    posting_date: datetime
+    closing_date: Optional[datetime] = None
+    status: JobStatus
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+class JobSummaryPage(BaseModel):
+    items: List[JobSummaryOut]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
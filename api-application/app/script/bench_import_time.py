@@ -0,0 +1,87 @@
+"""
+Measure how long a fresh interpreter takes to import app.main, and fail past a budget.
+
+    python -m app.script.bench_import_time [budget-ms] [runs]
+
+Each run is a new `python -X importtime` process, so nothing is shared between
+runs; the median of the cumulative time reported for app.main is compared to
+the budget. It also fails if a dependency that should load lazily (on the first
+request that needs it) shows up at import time, and prints the slowest
+top-level imports to show where a regression came from.
+"""
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+DEFAULT_BUDGET_MS = 2000
+DEFAULT_RUNS = 5
+
+# Only needed by a few routes or by the migration step
+LAZY_MODULES = ("weasyprint", "jinja2", "passlib", "bcrypt", "jose", "alembic")
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|(?P<indent> *)(?P<module>\S+)$")
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def import_once() -> tuple[float, list[tuple[str, float]], list[str]]:
+    code = (
+        "import sys, app.main; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+
+    total_ms = None
+    top_level, children = [], []
+    # Output is post-order: a module's direct imports (two more spaces of indent) come before it
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        cumulative_ms = int(match["cumulative"]) / 1000
+        depth = len(match["indent"])
+        if depth == 3:
+            children.append((match["module"], cumulative_ms))
+        elif depth == 1:
+            if match["module"] == "app.main":
+                total_ms = cumulative_ms
+                top_level = children
+            children = []
+
+    eager = [name for name in result.stdout.strip().split(",") if name]
+    return total_ms, top_level, eager
+
+
+def run(budget_ms: float = DEFAULT_BUDGET_MS, runs: int = DEFAULT_RUNS) -> bool:
+    totals = []
+    top_level, eager = [], []
+    for _ in range(runs):
+        total_ms, top_level, eager = import_once()
+        totals.append(total_ms)
+
+    median_ms = statistics.median(totals)
+    print(f"import app.main: median {median_ms:.0f} ms, min {min(totals):.0f} ms, max {max(totals):.0f} ms over {runs} runs")
+    print("Slowest imports made by app.main:")
+    for module, ms in sorted(top_level, key=lambda item: item[1], reverse=True)[:10]:
+        print(f"  {ms:8.1f} ms  {module}")
+
+    ok = True
+    if eager:
+        ok = False
+        print(f"❌ loaded at import time, should be lazy: {', '.join(eager)}")
+    if median_ms > budget_ms:
+        ok = False
+        print(f"❌ {median_ms:.0f} ms is over the {budget_ms:.0f} ms budget")
+    elif ok:
+        print(f"✅ within the {budget_ms:.0f} ms budget")
+    return ok
+
+
+if __name__ == "__main__":
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else float(os.getenv("IMPORT_TIME_BUDGET_MS", DEFAULT_BUDGET_MS))
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_RUNS
+    sys.exit(0 if run(budget, runs) else 1)
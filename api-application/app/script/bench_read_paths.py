@@ -0,0 +1,66 @@
+"""
+Compare sync vs async throughput of the public job list query in one process.
+
+    python -m app.script.bench_read_paths [requests] [concurrency]
+
+The sync side runs get_all_active_jobs on a thread pool the size of Starlette's
+default (40 threads), the way sync routes run; the async side runs
+get_all_active_jobs_async on one event loop with the same concurrency. Both go
+straight to the database (no response cache), and both engines use the same
+pool settings, so raise DB_POOL_SIZE/DB_MAX_OVERFLOW to see the pool ceiling move.
+"""
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from app.database.session import SessionLocal, engine
+from app.database.async_session import AsyncSessionLocal, async_engine
+from app.controllers.job_controller import get_all_active_jobs, get_all_active_jobs_async
+
+STARLETTE_THREADPOOL_SIZE = 40
+
+
+def sync_request():
+    db = SessionLocal()
+    try:
+        get_all_active_jobs(db, 0, 50)
+    finally:
+        db.close()
+
+
+def bench_sync(requests: int, concurrency: int) -> float:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(concurrency, STARLETTE_THREADPOOL_SIZE)) as pool:
+        list(pool.map(lambda _: sync_request(), range(requests)))
+    return time.perf_counter() - started
+
+
+async def bench_async(requests: int, concurrency: int) -> float:
+    limit = asyncio.Semaphore(concurrency)
+
+    async def async_request():
+        async with limit:
+            async with AsyncSessionLocal() as db:
+                await get_all_active_jobs_async(db, 0, 50)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(async_request() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    await async_engine.dispose()
+    return elapsed
+
+
+def report(name: str, requests: int, elapsed: float):
+    print(f"{name:>5}: {requests} requests in {elapsed:.2f}s → {requests / elapsed:.0f} req/s")
+
+
+if __name__ == "__main__":
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    # asyncpg connections are bound to their event loop, so only the sync pool can be warmed up front
+    sync_request()
+
+    report("sync", requests, bench_sync(requests, concurrency))
+    report("async", requests, asyncio.run(bench_async(requests, concurrency)))
+    engine.dispose()
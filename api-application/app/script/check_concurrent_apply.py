@@ -0,0 +1,71 @@
+"""
+Fire many simultaneous applies for one (job, candidate) pair and check they converge.
+
+    python -m app.script.check_concurrent_apply <job_id> <candidate_id> [concurrency]
+
+The job must be open and the candidate must have a primary resume. Each apply
+runs in its own thread and session, released together by a barrier; sessions
+beyond the pool size queue for a connection, which still races the conflict
+path. Passes when every apply succeeds with a single SQL statement, they all
+return the same application, and exactly one row exists for the pair afterwards.
+"""
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import func, select
+from app.database.session import SessionLocal
+from app.database.query_stats import count_queries
+from app.models.job_application_model import JobApplication
+from app.controllers.job_application_controller import apply_to_job
+
+
+def run(job_id: int, candidate_id: int, concurrency: int = 100) -> bool:
+    barrier = threading.Barrier(concurrency)
+
+    def apply_once():
+        with SessionLocal() as db:
+            barrier.wait()
+            with count_queries() as stats:
+                application = apply_to_job(db, job_id, candidate_id)
+            return application.pk_id, stats.count
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(apply_once) for _ in range(concurrency)]
+        results, errors = [], []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                errors.append(e)
+
+    with SessionLocal() as db:
+        rows = db.scalar(
+            select(func.count())
+            .select_from(JobApplication)
+            .where(JobApplication.job_id == job_id, JobApplication.candidate_id == candidate_id)
+        )
+
+    application_ids = {pk_id for pk_id, _ in results}
+    statements = sorted({count for _, count in results})
+    checks = [
+        (f"{len(results)}/{concurrency} applies succeeded", not errors),
+        (f"returned application ids: {sorted(application_ids)}", len(application_ids) == 1),
+        (f"statements per apply: {statements}", statements == [1]),
+        (f"rows for the pair: {rows}", rows == 1),
+    ]
+    for error in errors[:3]:
+        print(f"   {error!r}")
+
+    ok = True
+    for description, passed in checks:
+        ok = ok and passed
+        print(f"{'✅' if passed else '❌'} {description}")
+    return ok
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(2)
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    sys.exit(0 if run(int(sys.argv[1]), int(sys.argv[2]), concurrency) else 1)
@@ -0,0 +1,99 @@
+"""
+Fail if any route holds more than one pooled DB connection at a time per request.
+
+    python -m app.script.check_connections_per_request [bearer-token] [--read-only]
+
+Every route in the OpenAPI schema is called once, anonymously and, when a token
+is given, as that user. Path parameters are filled with 1 and JSON bodies with
+the smallest value the schema accepts, so most writes get as far as their
+queries. POST/PUT/PATCH requests are sent for real: run against a disposable
+database, or pass --read-only to call GET routes only. Exits non-zero if the
+checkout guard saw a route go over DB_MAX_CHECKOUTS_PER_REQUEST.
+"""
+import re
+import sys
+from fastapi.testclient import TestClient
+from app.main import app
+from app.database import checkout_guard
+
+READ_METHODS = ("get",)
+WRITE_METHODS = ("post", "put", "patch")
+
+# Would end the session the remaining authenticated calls rely on
+SKIPPED = {("post", "/user/logout"), ("post", "/user/change-password")}
+
+PATH_PARAM = re.compile(r"\{[^}]+\}")
+
+
+def sample_value(schema: dict, components: dict):
+    """Smallest JSON value matching an OpenAPI schema: required fields only, first enum member"""
+    if "$ref" in schema:
+        return sample_value(components[schema["$ref"].rsplit("/", 1)[-1]], components)
+    for combined in ("anyOf", "oneOf", "allOf"):
+        if combined in schema:
+            options = [option for option in schema[combined] if option.get("type") != "null"]
+            return sample_value(options[0], components) if options else None
+    if "default" in schema:
+        return schema["default"]
+    if "enum" in schema:
+        return schema["enum"][0]
+
+    kind = schema.get("type")
+    if kind == "object":
+        properties = schema.get("properties", {})
+        return {name: sample_value(properties[name], components) for name in schema.get("required", [])}
+    if kind == "array":
+        return []
+    if kind == "integer":
+        return 1
+    if kind == "number":
+        return 1.0
+    if kind == "boolean":
+        return False
+    if kind == "string":
+        return {"date-time": "2026-01-01T00:00:00", "date": "2026-01-01", "email": "check@example.com"}.get(
+            schema.get("format"), "check"
+        )
+    return None
+
+
+def planned_requests(read_only: bool) -> list[tuple[str, str, dict | None]]:
+    spec = app.openapi()
+    components = spec.get("components", {}).get("schemas", {})
+    methods = READ_METHODS if read_only else READ_METHODS + WRITE_METHODS
+
+    planned = []
+    for path, operations in sorted(spec["paths"].items()):
+        for method, operation in operations.items():
+            if method not in methods or (method, path) in SKIPPED:
+                continue
+            body = None
+            content = operation.get("requestBody", {}).get("content", {})
+            if "application/json" in content:
+                body = sample_value(content["application/json"]["schema"], components)
+            planned.append((method, PATH_PARAM.sub("1", path), body))
+    return planned
+
+
+def run(token: str | None = None, read_only: bool = False) -> bool:
+    headers = [{}]
+    if token:
+        headers.append({"Authorization": f"Bearer {token}"})
+
+    checkout_guard.violations.clear()
+    with TestClient(app) as client:
+        for method, path, body in planned_requests(read_only):
+            for header in headers:
+                response = client.request(method.upper(), path, headers=header, json=body)
+                print(f"{response.status_code} {method.upper()} {path}{' (auth)' if header else ''}")
+
+    for violation in checkout_guard.violations:
+        print(f"❌ {violation['method']} {violation['path']}: {violation['checkouts']} connections at once")
+    if not checkout_guard.violations:
+        print("✅ every request held a single connection at a time")
+    return not checkout_guard.violations
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--read-only"]
+    sys.exit(0 if run(args[0] if args else None, "--read-only" in sys.argv[1:]) else 1)
@@ -0,0 +1,88 @@
+"""
+Assert that the planner can serve the hot lookups from their indexes.
+
+    python -m app.script.check_index_usage
+
+Sequential scans are disabled for the check, so the result doesn't depend on
+how much data the database holds. Exits non-zero if any query misses its index.
+"""
+import sys
+from sqlalchemy import text
+from app.database.session import engine
+
+# (description, query, index the plan must use)
+HOT_QUERIES = [
+    ("employer by user", "SELECT * FROM t_employer WHERE user_id = 1", "ix_t_employer_user_id"),
+    (
+        "open jobs, newest first",
+        "SELECT * FROM t_job WHERE status = 'OPEN' ORDER BY created_at DESC, pk_id DESC LIMIT 50",
+        "ix_t_job_status_created_at_pk_id",
+    ),
+    (
+        "jobs of an employer",
+        "SELECT * FROM t_job WHERE employer_id = 1 ORDER BY created_at DESC, pk_id DESC LIMIT 20",
+        "ix_t_job_employer_id_created_at_pk_id",
+    ),
+    (
+        "application of a candidate to a job",
+        "SELECT * FROM t_job_application WHERE job_id = 1 AND candidate_id = 1",
+        "uq_t_job_application_job_id_candidate_id",
+    ),
+    (
+        "applicants of a job, newest first",
+        "SELECT * FROM t_job_application WHERE job_id = 1 ORDER BY applied_date DESC, pk_id DESC LIMIT 50",
+        "ix_t_job_application_job_id_applied_date_pk_id",
+    ),
+    (
+        "applications of a candidate, newest first",
+        "SELECT * FROM t_job_application WHERE candidate_id = 1 ORDER BY applied_date DESC, pk_id DESC LIMIT 20",
+        "ix_t_job_application_candidate_id_applied_date_pk_id",
+    ),
+    (
+        "resumes of a candidate",
+        "SELECT * FROM t_candidate_resume WHERE candidate_id = 1",
+        "ix_t_candidate_resume_candidate_id",
+    ),
+    (
+        "primary resume",
+        "SELECT * FROM t_candidate_resume WHERE candidate_id = 1 AND is_primary",
+        "ix_t_candidate_resume_candidate_id_primary",
+    ),
+    (
+        "session by token",
+        "SELECT * FROM t_user_session WHERE token_digest = repeat('0', 64)",
+        "ux_t_user_session_token_digest",
+    ),
+    (
+        "user by email",
+        "SELECT * FROM t_user WHERE lower(email) = 'someone@example.com'",
+        "ix_t_user_email_lower",
+    ),
+]
+
+
+def collect_index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= collect_index_names(child)
+    return names
+
+
+def run() -> bool:
+    ok = True
+    with engine.connect() as conn:
+        with conn.begin():
+            conn.execute(text("SET LOCAL enable_seqscan = off"))
+            for description, query, index_name in HOT_QUERIES:
+                plan = conn.execute(text(f"EXPLAIN (FORMAT JSON) {query}")).scalar()[0]["Plan"]
+                used = collect_index_names(plan)
+                if index_name in used:
+                    print(f"✅ {description}: {index_name}")
+                else:
+                    ok = False
+                    print(f"❌ {description}: expected {index_name}, plan used {sorted(used) or 'no index'}")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run() else 1)
@@ -0,0 +1,64 @@
+"""
+Fail if a route runs more SQL statements than its budget.
+
+    python -m app.script.check_query_budgets [bearer-token]
+
+Counts come from the Server-Timing header added by QueryStatsMiddleware (turned
+on here whatever SERVER_TIMING_ENABLED says), so they are the same numbers an
+ops-enabled deployment reports. Budgets are for a
+cold response cache; the authenticated routes are skipped without a token.
+"""
+import sys
+from fastapi.testclient import TestClient
+from app.main import app
+from app.config.settings import settings
+from app.database.query_stats import SERVER_TIMING_PATTERN
+from app.utils.cache import response_cache, principal_cache
+
+# (path, needs auth, max statements)
+ROUTE_BUDGETS = [
+    ("/jobs/", False, 2),
+    ("/jobs/page", False, 2),
+    ("/jobs/summary", False, 2),
+    ("/jobs/search?q=developer", False, 2),
+    ("/jobs/facets", False, 1),
+    ("/categories/", False, 1),
+    ("/jobs/my-jobs", True, 3),
+    ("/applications/pipeline", True, 2),
+    ("/applications/mine", True, 2),
+    ("/applications/my-status?job_ids=1&job_ids=2&job_ids=3", True, 2),
+    ("/admin/candidates", True, 2),
+    ("/user/profile", True, 2),
+]
+
+
+def run(token: str | None = None) -> bool:
+    settings.SERVER_TIMING_ENABLED = True
+    ok = True
+    with TestClient(app) as client:
+        for path, needs_auth, budget in ROUTE_BUDGETS:
+            if needs_auth and not token:
+                print(f"⏭️ {path}: needs a token")
+                continue
+
+            response_cache.clear()
+            principal_cache.clear()
+            headers = {"Authorization": f"Bearer {token}"} if needs_auth else {}
+            response = client.get(path, headers=headers)
+            match = SERVER_TIMING_PATTERN.search(response.headers.get("server-timing", ""))
+            if match is None:
+                ok = False
+                print(f"❌ {path}: no Server-Timing header (status {response.status_code})")
+                continue
+
+            count = int(match["count"])
+            if count > budget:
+                ok = False
+                print(f"❌ {path}: {count} queries, budget {budget}")
+            else:
+                print(f"✅ {path}: {count}/{budget} queries in {match['ms']} ms")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run(sys.argv[1] if len(sys.argv) > 1 else None) else 1)
@@ -0,0 +1,50 @@
+"""
+Check that reads, writes and sticky clients reach the right database.
+
+    DATABASE_REPLICA_URLS='["postgresql://.../recruitment_db"]' python -m app.script.check_replica_routing
+
+The replica URL may point at a second Postgres instance or, as a stand-in, at the
+primary itself: replica engines connect with application_name "replica-N", so the
+check tells them apart by asking the server which connection served each query.
+"""
+import sys
+from sqlalchemy import func, select, text
+from app.database.session import SessionLocal, replica_engines
+
+APPLICATION_NAME = select(func.current_setting("application_name"))
+RAW_APPLICATION_NAME = text("SELECT current_setting('application_name')")
+
+
+def served_by(db, stmt=APPLICATION_NAME, **execution_options) -> str:
+    return db.execute(stmt.execution_options(**execution_options)).scalar()
+
+
+def run() -> bool:
+    if not replica_engines:
+        print("❌ DATABASE_REPLICA_URLS is empty")
+        return False
+
+    results = []
+    with SessionLocal(info={"replica": True}) as db:
+        results.append(("read-only session, plain read", served_by(db), True))
+        results.append(("read-only session, use_primary", served_by(db, use_primary=True), False))
+        results.append(("read-only session, unmarked text()", served_by(db, RAW_APPLICATION_NAME), False))
+        results.append((
+            "read-only session, text() marked read_only",
+            served_by(db, RAW_APPLICATION_NAME, read_only=True),
+            True,
+        ))
+    with SessionLocal(info={"replica": False}) as db:
+        results.append(("sticky/write session, plain read", served_by(db), False))
+
+    ok = True
+    for description, application_name, expect_replica in results:
+        on_replica = application_name.startswith("replica-")
+        passed = on_replica == expect_replica
+        ok = ok and passed
+        print(f"{'✅' if passed else '❌'} {description}: {application_name or '(primary)'}")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run() else 1)
@@ -1,4 +1,5 @@
 from app.utils.run_sql_script import run_sql_script
+from app.utils.cache import response_cache, CATEGORIES_TAG
 
 SQL_SCRIPT = """
 
@@ -103,3 +104,5 @@ def run():
         SQL_SCRIPT,
         success_message="Category seed script executed successfully."
     )
+    # The only writer of t_category; drop cached /categories/ bodies (shared when CACHE_BACKEND=redis)
+    response_cache.invalidate(CATEGORIES_TAG)
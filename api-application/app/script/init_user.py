@@ -2,33 +2,7 @@ from app.utils.run_sql_script import run_sql_script
 
 SQL_SCRIPT = """
 -- ===============================
--- 1️⃣ Ensure column types & defaults safely
--- ===============================
-
-ALTER TABLE t_user
-    ALTER COLUMN is_active TYPE BOOLEAN
-    USING is_active::BOOLEAN;
-
-ALTER TABLE t_user
-    ALTER COLUMN created_date SET DEFAULT NOW();
-
-ALTER TABLE t_user
-    ALTER COLUMN is_active SET DEFAULT TRUE;
-
--- ===============================
--- 2️⃣ Fix existing NULL values
--- ===============================
-
-UPDATE t_user
-SET created_date = NOW()
-WHERE created_date IS NULL;
-
-UPDATE t_user
-SET is_active = TRUE
-WHERE is_active IS NULL;
-
--- ===============================
--- 3️⃣ Seed admin user (NO DUPLICATION)
+-- 1️⃣ Seed admin user (NO DUPLICATION)
 -- ===============================
 
 DO $$
@@ -67,7 +41,7 @@ END
 $$;
 
 -- ===============================
--- 4️⃣ Reset sequence safely
+-- 2️⃣ Reset sequence safely
 -- ===============================
 
 SELECT setval(
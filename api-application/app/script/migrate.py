@@ -0,0 +1,112 @@
+"""
+Bring the schema to the latest Alembic revision and seed reference data.
+
+    python -m app.script.migrate
+
+Runs from the app lifespan when RUN_MIGRATIONS_ON_STARTUP is set, or once from a
+deploy step with the setting turned off. Workers that find the schema already at
+head return without locking; otherwise a Postgres advisory lock makes sure only
+one process migrates while the others wait and then re-check.
+"""
+import os
+import sys
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from app.database.session import Base, engine
+import app.models.user_model
+import app.models.user_session_model
+import app.models.employer_model
+import app.models.category_model
+import app.models.job_model
+import app.models.candidate_model
+import app.models.candidate_profile
+import app.models.candidate_resume_model
+import app.models.job_application_model
+import app.models.job_application_count_model
+import app.models.maintenance_run_model
+from app.script.init_user import run as init_user
+from app.script.init_category import run as init_category
+
+# Arbitrary, but must be the same for every worker
+MIGRATION_LOCK_KEY = 72_410_018
+
+ALEMBIC_INI = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "alembic.ini"))
+
+
+def alembic_config() -> Config:
+    return Config(ALEMBIC_INI)
+
+
+def head_revision(cfg: Config) -> str:
+    return ScriptDirectory.from_config(cfg).get_current_head()
+
+
+def current_revision(conn) -> str | None:
+    return MigrationContext.configure(conn).get_current_revision()
+
+
+def ensure_schema_current():
+    """
+    Refuse to serve against an older schema. Code and migrations ship together (e.g. the
+    login path needs t_user_session.token_digest), so a worker started with
+    RUN_MIGRATIONS_ON_STARTUP off must find the deploy step has already migrated.
+    """
+    head = head_revision(alembic_config())
+    with engine.connect() as conn:
+        revision = current_revision(conn)
+    if revision != head:
+        raise RuntimeError(
+            f"Database schema is at {revision or 'no revision'}, this build needs {head}. "
+            "Run `python -m app.script.migrate` or enable RUN_MIGRATIONS_ON_STARTUP."
+        )
+
+
+def run() -> bool:
+    """Returns True when this process applied anything"""
+    cfg = alembic_config()
+    head = head_revision(cfg)
+
+    with engine.connect() as conn:
+        if current_revision(conn) == head:
+            return False
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        conn.commit()
+        try:
+            # Another worker may have finished while we waited for the lock
+            revision = current_revision(conn)
+            if revision == head:
+                print("Schema already at head.")
+                return False
+
+            # Alembic runs on the connection holding the lock (env.py then leaves logging alone)
+            cfg.attributes["connection"] = conn
+            if revision is None and not inspect(conn).get_table_names():
+                print("Empty database: creating tables...")
+                Base.metadata.create_all(conn)
+                command.stamp(cfg, "head")
+            else:
+                print(f"Upgrading schema {revision} -> {head}...")
+                command.upgrade(cfg, "head")
+            conn.commit()
+
+            init_user()
+            init_category()
+            print("Migrations complete.")
+            return True
+        finally:
+            conn.rollback()
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            conn.commit()
+
+
+if __name__ == "__main__":
+    try:
+        run()
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,343 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from app.config.settings import settings
+
+# Tags group cache entries so writes can drop everything that depends on a row
+JOBS_TAG = "jobs"
+CATEGORIES_TAG = "categories"
+
+
+def job_tag(job_id: int) -> str:
+    return f"job:{job_id}"
+
+
+def employer_tag(employer_id: int) -> str:
+    return f"employer:{employer_id}"
+
+
+def user_tag(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def session_tag(token_digest: str) -> str:
+    return f"session:{token_digest}"
+
+
+def redis_client(url: str):
+    """Synchronous client from the optional `redis` package"""
+    try:
+        import redis
+    except ImportError:
+        raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package to be installed")
+    return redis.Redis.from_url(url)
+
+
+class MemoryCacheBackend:
+    """In-process LRU with a per-entry TTL. Each worker process has its own copy."""
+
+    name = "memory"
+    blocking = False
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        # Kept outside the LRU: an evicted tag version would make stale entries valid again
+        self._tag_versions = {}
+        self._tag_expiry = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def tag_versions(self, tags) -> list[int]:
+        with self._lock:
+            return [self._tag_versions.get(tag, 0) for tag in tags]
+
+    def bump_tag(self, tag: str, ttl: float | None = None):
+        """With a ttl the version is dropped once no entry stored before the bump can still be alive"""
+        with self._lock:
+            self._generation += 1
+            self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+            now = time.monotonic()
+            if ttl is not None:
+                self._tag_expiry[tag] = now + ttl
+            for expired in [t for t, expires_at in self._tag_expiry.items() if expires_at < now]:
+                del self._tag_expiry[expired]
+                self._tag_versions.pop(expired, None)
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tag_versions.clear()
+            self._tag_expiry.clear()
+            self._generation += 1
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """Shared cache for multi-worker deployments. Needs the optional `redis` package."""
+
+    name = "redis"
+    blocking = True
+
+    def __init__(self, url: str, prefix: str = "rc:"):
+        self.prefix = prefix
+        self._client = redis_client(url)
+
+    @staticmethod
+    def _encode(entry) -> bytes:
+        # A JSON header line, then the body bytes as-is: nothing read back from Redis is ever unpickled
+        tags, versions, value = entry
+        if isinstance(value, bytes):
+            body, extra = value, None
+        elif isinstance(value, tuple) and value and isinstance(value[0], bytes):
+            body, extra = value[0], list(value[1:])
+        else:
+            raise TypeError("RedisCacheBackend only stores bytes, or a tuple of bytes followed by JSON values")
+        header = json.dumps({"tags": list(tags), "versions": versions, "extra": extra}, separators=(",", ":"))
+        return header.encode() + b"\n" + body
+
+    @staticmethod
+    def _decode(raw: bytes):
+        header, _, body = raw.partition(b"\n")
+        meta = json.loads(header)
+        value = body if meta["extra"] is None else (body, *meta["extra"])
+        return tuple(meta["tags"]), meta["versions"], value
+
+    def get(self, key):
+        raw = self._client.get(self.prefix + key)
+        return self._decode(raw) if raw is not None else None
+
+    def set(self, key, value, ttl: float):
+        self._client.set(self.prefix + key, self._encode(value), ex=max(int(ttl), 1))
+
+    def delete(self, key):
+        self._client.delete(self.prefix + key)
+
+    def tag_versions(self, tags) -> list[int]:
+        if not tags:
+            return []
+        values = self._client.mget([f"{self.prefix}tag:{tag}" for tag in tags])
+        return [int(value) if value is not None else 0 for value in values]
+
+    def bump_tag(self, tag: str, ttl: float | None = None):
+        # Generation first: a reader that sees the new tag version also sees the new generation
+        with self._client.pipeline(transaction=True) as pipe:
+            pipe.incr(f"{self.prefix}generation")
+            pipe.incr(f"{self.prefix}tag:{tag}")
+            if ttl is not None:
+                pipe.expire(f"{self.prefix}tag:{tag}", max(int(ttl) + 1, 1))
+            pipe.execute()
+
+    def generation(self) -> int:
+        value = self._client.get(f"{self.prefix}generation")
+        return int(value) if value is not None else 0
+
+    def clear(self):
+        for key in self._client.scan_iter(match=self.prefix + "*"):
+            if key != (self.prefix + "generation").encode():
+                self._client.delete(key)
+        self._client.incr(f"{self.prefix}generation")
+
+    def size(self) -> int | None:
+        return None
+
+
+class SharedTagsBackend:
+    """
+    Entries in this process, tag versions and the generation in a shared backend.
+    Lookups stay local, but an invalidation made by any worker is seen by all of them
+    on their next read, at the cost of one round trip for the tag versions.
+    """
+
+    blocking = True
+
+    def __init__(self, local: MemoryCacheBackend, shared: RedisCacheBackend):
+        self.local = local
+        self.shared = shared
+        self.name = f"{local.name}+{shared.name}-tags"
+
+    def get(self, key):
+        return self.local.get(key)
+
+    def set(self, key, value, ttl: float):
+        self.local.set(key, value, ttl)
+
+    def delete(self, key):
+        self.local.delete(key)
+
+    def tag_versions(self, tags) -> list[int]:
+        return self.shared.tag_versions(tags)
+
+    def bump_tag(self, tag: str, ttl: float | None = None):
+        self.shared.bump_tag(tag, ttl)
+
+    def generation(self) -> int:
+        return self.shared.generation()
+
+    def clear(self):
+        self.local.clear()
+        self.shared.clear()
+
+    def size(self) -> int:
+        return self.local.size()
+
+
+class ResponseCache:
+    """
+    Tag-invalidated cache for rendered responses.
+    Every entry remembers the version of each of its tags when it was stored;
+    invalidating a tag bumps its version, so older entries simply stop matching.
+
+    Take a snapshot() before reading the data and pass it to set(): if anything
+    was invalidated in between, the value may predate that write and is not stored.
+
+    `async def` routes use the *_async variants: with a network backend they run
+    on the threadpool instead of blocking the event loop.
+    """
+
+    def __init__(self, backend, default_ttl: float = 60):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self._stats = {"hits": 0, "misses": 0, "sets": 0, "stale_sets_skipped": 0, "invalidations": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name: str):
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def get(self, key: str):
+        entry = self.backend.get(key)
+        if entry is not None:
+            tags, versions, value = entry
+            if self.backend.tag_versions(tags) == versions:
+                self._count("hits")
+                return value
+            self.backend.delete(key)
+
+        self._count("misses")
+        return None
+
+    def snapshot(self) -> int:
+        """Invalidation generation; take it before running the query whose result gets cached"""
+        return self.backend.generation()
+
+    def set(self, key: str, value, tags=(), ttl: float | None = None, snapshot: int | None = None):
+        tags = tuple(tags)
+        versions = self.backend.tag_versions(tags)
+        # Checked after reading the versions, so a concurrent bump cannot slip between the two
+        if snapshot is not None and self.backend.generation() != snapshot:
+            self._count("stale_sets_skipped")
+            return
+        self.backend.set(key, (tags, versions, value), ttl if ttl is not None else self.default_ttl)
+        self._count("sets")
+
+    def get_or_set(self, key: str, factory, tags=(), ttl: float | None = None):
+        value = self.get(key)
+        if value is None:
+            snapshot = self.snapshot()
+            value = factory()
+            self.set(key, value, tags, ttl, snapshot=snapshot)
+        return value
+
+    async def _off_loop(self, method, *args, **kwargs):
+        if self.backend.blocking:
+            return await run_in_threadpool(method, *args, **kwargs)
+        return method(*args, **kwargs)
+
+    async def get_async(self, key: str):
+        return await self._off_loop(self.get, key)
+
+    async def snapshot_async(self) -> int:
+        return await self._off_loop(self.snapshot)
+
+    async def set_async(self, key: str, value, tags=(), ttl: float | None = None, snapshot: int | None = None):
+        await self._off_loop(self.set, key, value, tags, ttl, snapshot=snapshot)
+
+    def delete(self, key: str):
+        self.backend.delete(key)
+
+    def invalidate(self, *tags: str, ttl: float | None = None):
+        """ttl: how long the tag must stay bumped, for one-off tags (e.g. a revoked session)"""
+        for tag in tags:
+            self.backend.bump_tag(tag, ttl)
+        self._count("invalidations")
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["backend"] = self.backend.name
+        stats["entries"] = self.backend.size()
+        return stats
+
+
+def build_response_cache() -> ResponseCache:
+    if settings.CACHE_BACKEND == "redis":
+        if not settings.CACHE_REDIS_URL:
+            raise RuntimeError("CACHE_BACKEND=redis requires CACHE_REDIS_URL")
+        backend = RedisCacheBackend(settings.CACHE_REDIS_URL)
+    else:
+        backend = MemoryCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+    return ResponseCache(backend, default_ttl=settings.CACHE_DEFAULT_TTL_SECONDS)
+
+
+def render_json(adapter: TypeAdapter, data) -> bytes:
+    """Validate ORM objects/dicts against a response schema and dump straight to JSON bytes"""
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def build_principal_cache() -> ResponseCache:
+    """
+    Entries are always in-process: they are read on every request. With the redis
+    backend the tag versions are shared, so a logout or user change made on one
+    worker evicts the principal on all of them. With the memory backend other
+    workers keep serving their copy until PRINCIPAL_CACHE_TTL_SECONDS runs out.
+    """
+    backend = MemoryCacheBackend(max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES)
+    if settings.CACHE_BACKEND == "redis":
+        if not settings.CACHE_REDIS_URL:
+            raise RuntimeError("CACHE_BACKEND=redis requires CACHE_REDIS_URL")
+        backend = SharedTagsBackend(backend, RedisCacheBackend(settings.CACHE_REDIS_URL, prefix="pc:"))
+    return ResponseCache(backend, default_ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+response_cache = build_response_cache()
+
+# Authenticated principal per session-token digest
+principal_cache = build_principal_cache()
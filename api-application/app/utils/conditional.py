@@ -0,0 +1,64 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from fastapi import Request, Response
+
+
+def weak_etag(*parts) -> str:
+    """Weak validator built from row versions/timestamps rather than the rendered body"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def body_etag(body: bytes) -> str:
+    """Weak validator for payloads whose rows carry no version or timestamp column"""
+    return f'W/"{hashlib.sha1(body).hexdigest()[:20]}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _opaque_tag(etag: str) -> str:
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    """
+    Evaluate If-None-Match (weak comparison) and, only when it is absent,
+    If-Modified-Since, as RFC 9110 prescribes for GET/HEAD.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        wanted = _opaque_tag(etag)
+        return any(_opaque_tag(candidate) == wanted for candidate in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return _as_utc(last_modified) <= _as_utc(since)
+
+    return False
+
+
+def validator_headers(etag: str, last_modified: datetime | None = None, cache_control: str = "no-cache") -> dict:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def set_validators(response: Response, etag: str, last_modified: datetime | None = None, cache_control: str = "no-cache"):
+    response.headers.update(validator_headers(etag, last_modified, cache_control))
+
+
+def not_modified_response(etag: str, last_modified: datetime | None = None, cache_control: str = "no-cache") -> Response:
+    return Response(status_code=304, headers=validator_headers(etag, last_modified, cache_control))
@@ -0,0 +1,184 @@
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from app.config.settings import settings
+from app.database.session import SessionLocal, engine
+from app.controllers.user_controller import reap_expired_sessions
+from app.controllers.job_application_controller import reconcile_application_counts
+from app.models.maintenance_run_model import MaintenanceRun
+
+
+class PeriodicTask:
+    """
+    Runs a job on a daemon thread every `interval` seconds and keeps stats about the last run.
+    `initial_delay` postpones the first run; `manual_job` replaces `job` for runs
+    triggered from the ops API (e.g. to skip a "not due yet" check).
+    """
+
+    def __init__(self, name: str, interval: float, job, initial_delay: float = 0, manual_job=None):
+        self.name = name
+        self.interval = interval
+        self.initial_delay = initial_delay
+        self.job = job
+        self.manual_job = manual_job or job
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "runs": 0,
+            "failures": 0,
+            "last_started_at": None,
+            "last_duration_ms": None,
+            "last_result": None,
+            "last_error": None,
+        }
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self, manual: bool = False):
+        started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        result, error = None, None
+        try:
+            result = (self.manual_job if manual else self.job)()
+        except Exception as exc:
+            error = repr(exc)
+        duration_ms = round((time.perf_counter() - started) * 1000, 2)
+
+        with self._lock:
+            self._stats["runs"] += 1
+            self._stats["last_started_at"] = started_at.isoformat()
+            self._stats["last_duration_ms"] = duration_ms
+            self._stats["last_result"] = result
+            self._stats["last_error"] = error
+            if error is not None:
+                self._stats["failures"] += 1
+
+        if error is not None:
+            print(f"❌ {self.name} failed after {duration_ms} ms: {error}")
+        return result
+
+    def _loop(self):
+        # First run after initial_delay, then every interval; stop() interrupts either wait
+        if self._stop.wait(self.initial_delay):
+            return
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.interval)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["name"] = self.name
+        stats["interval_seconds"] = self.interval
+        stats["initial_delay_seconds"] = self.initial_delay
+        stats["running"] = self._thread is not None and self._thread.is_alive()
+        return stats
+
+
+def reap_sessions() -> dict:
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        reaped = reap_expired_sessions(
+            db,
+            batch_size=settings.SESSION_REAPER_BATCH_SIZE,
+            max_batches=settings.SESSION_REAPER_MAX_BATCHES,
+        )
+    finally:
+        db.close()
+    duration_ms = round((time.perf_counter() - started) * 1000, 2)
+    print(f"🧹 Reaped {reaped} expired sessions in {duration_ms} ms")
+    return {"reaped": reaped, "duration_ms": duration_ms}
+
+
+session_reaper = PeriodicTask(
+    "session-reaper",
+    interval=settings.SESSION_REAPER_INTERVAL_SECONDS,
+    job=reap_sessions,
+)
+
+
+# Arbitrary, but must be the same for every worker
+RECONCILE_LOCK_KEY = 72_410_022
+RECONCILE_TASK_NAME = "application-count-reconciler"
+
+
+def reconcile_counts(force: bool = False) -> dict:
+    """
+    Recount unless another worker is at it or a run completed within the interval.
+    The last completion is kept in t_maintenance_run, so restarts do not reset the schedule.
+    """
+    started = time.perf_counter()
+    interval = timedelta(seconds=settings.APPLICATION_COUNT_RECONCILE_INTERVAL_SECONDS)
+    # Held on its own connection for the whole run, so only one worker reconciles at a time
+    with engine.connect() as lock_conn:
+        if not lock_conn.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": RECONCILE_LOCK_KEY}):
+            print("⏭️ Application counts are being reconciled by another process")
+            return {"skipped": "another process is reconciling"}
+        try:
+            last_completed_at = lock_conn.scalar(
+                select(MaintenanceRun.last_completed_at).where(
+                    MaintenanceRun.task_name == RECONCILE_TASK_NAME,
+                    MaintenanceRun.last_completed_at > func.now() - interval,
+                )
+            )
+            lock_conn.commit()
+            if last_completed_at is not None and not force:
+                return {"skipped": f"last completed at {last_completed_at.isoformat()}"}
+
+            db = SessionLocal()
+            try:
+                result = reconcile_application_counts(db, batch_size=settings.APPLICATION_COUNT_RECONCILE_BATCH_SIZE)
+            finally:
+                db.close()
+
+            lock_conn.execute(
+                insert(MaintenanceRun)
+                .values(task_name=RECONCILE_TASK_NAME, last_completed_at=func.now())
+                .on_conflict_do_update(index_elements=[MaintenanceRun.task_name], set_={"last_completed_at": func.now()})
+            )
+            lock_conn.commit()
+        finally:
+            lock_conn.rollback()
+            lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": RECONCILE_LOCK_KEY})
+            lock_conn.commit()
+    result["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    if result["repaired"]:
+        print(f"⚠️ Repaired {result['repaired']} drifted application counters")
+    return result
+
+
+application_count_reconciler = PeriodicTask(
+    RECONCILE_TASK_NAME,
+    # Only checks whether a run is due; the recount itself happens once per interval across all workers
+    interval=settings.APPLICATION_COUNT_RECONCILE_CHECK_SECONDS,
+    job=reconcile_counts,
+    manual_job=lambda: reconcile_counts(force=True),
+    # Jittered so workers booting together do not all queue on the lock at once
+    initial_delay=random.uniform(0, 60),
+)
+
+# Every scheduled maintenance task, started and stopped with the app
+MAINTENANCE_TASKS = [
+    task
+    for task, enabled in (
+        (session_reaper, settings.SESSION_REAPER_ENABLED),
+        (application_count_reconciler, settings.APPLICATION_COUNT_RECONCILE_ENABLED),
+    )
+    if enabled
+]
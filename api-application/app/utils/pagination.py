@@ -0,0 +1,90 @@
+import base64
+import json
+from datetime import datetime
+from fastapi import HTTPException, status
+from sqlalchemy import literal, tuple_
+from sqlalchemy.orm import Session
+
+CURSOR_NEXT = "next"
+CURSOR_PREV = "prev"
+
+
+def encode_cursor(sort_value: datetime, pk_id: int, direction: str = CURSOR_NEXT) -> str:
+    """Pack a (timestamp, pk_id) keyset position into an opaque url-safe string"""
+    raw = json.dumps([sort_value.isoformat(), pk_id, direction], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, pk_id, direction = json.loads(base64.urlsafe_b64decode(padded))
+        if direction not in (CURSOR_NEXT, CURSOR_PREV):
+            raise ValueError("Unknown cursor direction")
+        return datetime.fromisoformat(sort_value), int(pk_id), direction
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def keyset_page(
+    db: Session,
+    stmt,
+    sort_column,
+    pk_column,
+    limit: int,
+    cursor: str | None = None,
+    scalars: bool = True,
+) -> dict:
+    """
+    Run `stmt` as a newest-first keyset page on (sort_column, pk_column).
+    Fetches one extra row to know whether another page exists, so every page
+    costs one index range scan no matter how deep the client has scrolled.
+    Pass scalars=False when `stmt` selects columns instead of an ORM entity.
+    """
+    direction = CURSOR_NEXT
+    if cursor:
+        sort_value, pk_id, direction = decode_cursor(cursor)
+        position = tuple_(sort_column, pk_column)
+        boundary = tuple_(literal(sort_value, sort_column.type), literal(pk_id, pk_column.type))
+        if direction == CURSOR_NEXT:
+            stmt = stmt.where(position < boundary)
+        else:
+            stmt = stmt.where(position > boundary)
+
+    if direction == CURSOR_NEXT:
+        stmt = stmt.order_by(sort_column.desc(), pk_column.desc())
+    else:
+        stmt = stmt.order_by(sort_column.asc(), pk_column.asc())
+
+    result = db.execute(stmt.limit(limit + 1))
+    rows = list(result.unique().scalars().all() if scalars else result.all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if direction == CURSOR_PREV:
+        rows.reverse()
+
+    return page_from_rows(
+        rows,
+        has_older=has_more if direction == CURSOR_NEXT else bool(cursor),
+        has_newer=bool(cursor) if direction == CURSOR_NEXT else has_more,
+        key=lambda row: (getattr(row, sort_column.key), getattr(row, pk_column.key)),
+    )
+
+
+def page_from_rows(rows: list, has_older: bool, has_newer: bool, key) -> dict:
+    next_cursor = None
+    prev_cursor = None
+    if rows and has_older:
+        next_cursor = encode_cursor(*key(rows[-1]), CURSOR_NEXT)
+    if rows and has_newer:
+        prev_cursor = encode_cursor(*key(rows[0]), CURSOR_PREV)
+
+    return {
+        "items": rows,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor,
+    }
@@ -0,0 +1,156 @@
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from fastapi import HTTPException, status
+from app.config.settings import settings
+
+# One CryptContext per worker process, built on first use
+_crypt_context = None
+
+
+def _context():
+    global _crypt_context
+    if _crypt_context is None:
+        from passlib.context import CryptContext
+        _crypt_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+    return _crypt_context
+
+
+def _hash_in_worker(password: str):
+    started = time.time()
+    return _context().hash(password), started, time.time()
+
+
+def _verify_in_worker(password: str, hashed_password: str):
+    started = time.time()
+    return _context().verify(password, hashed_password), started, time.time()
+
+
+class _Timings:
+    """Recent samples in milliseconds, enough for percentiles on the ops endpoint"""
+
+    def __init__(self, size: int = 1024):
+        self._samples = deque(maxlen=size)
+
+    def add(self, ms: float):
+        self._samples.append(ms)
+
+    def summary(self) -> dict:
+        samples = sorted(self._samples)
+        if not samples:
+            return {"samples": 0, "avg_ms": None, "p50_ms": None, "p95_ms": None, "max_ms": None}
+        return {
+            "samples": len(samples),
+            "avg_ms": round(sum(samples) / len(samples), 2),
+            "p50_ms": round(samples[len(samples) // 2], 2),
+            "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 2),
+            "max_ms": round(samples[-1], 2),
+        }
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a small process pool so a login burst burns those cores only,
+    not the GIL the rest of the API shares. At most `max_pending` calls may be
+    queued or running; anything beyond that is rejected with 503 straight away.
+    """
+
+    def __init__(self, workers: int, max_pending: int, timeout: float, retry_after: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._counts = {"completed": 0, "rejected": 0, "timed_out": 0, "in_flight": 0}
+        self._hash_latency = _Timings()
+        self._queue_wait = _Timings()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # spawn: forking a process that already runs threads can copy held locks
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _count(self, name: str, delta: int = 1):
+        with self._stats_lock:
+            self._counts[name] += delta
+
+    def _saturated(self) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign-in requests, please retry shortly",
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+    def _release(self, future):
+        self._count("in_flight", -1)
+        self._slots.release()
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            self._count("rejected")
+            raise self._saturated()
+
+        self._count("in_flight")
+        submitted = time.time()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._release(None)
+            raise
+        # The slot belongs to the work, not the request: a timed-out hash that is already
+        # running cannot be cancelled and keeps its slot until the worker finishes it
+        future.add_done_callback(self._release)
+
+        try:
+            result, started, finished = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self._count("timed_out")
+            raise self._saturated()
+
+        with self._stats_lock:
+            self._counts["completed"] += 1
+            self._queue_wait.add(max(started - submitted, 0) * 1000)
+            self._hash_latency.add((finished - started) * 1000)
+        return result
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash_in_worker, password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self._run(_verify_in_worker, password, hashed_password)
+
+    def shutdown(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                **self._counts,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "hash_latency": self._hash_latency.summary(),
+                "queue_wait": self._queue_wait.summary(),
+            }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER_SECONDS,
+)
@@ -1,9 +1,16 @@
-from jose import JWTError, jwt
+import hashlib
 from fastapi import HTTPException, status
 from app.config.settings import settings
 from sqlalchemy.orm import Session
 
+def hash_token(token: str) -> str:
+    """Fixed-width digest used to look sessions up without storing the JWT"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
 def verify_token(token: str, db: Session) -> int:
+    # python-jose is imported on first use, not at worker startup
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM], options={"verify_exp": False})
         user_id = payload.get("user_id")